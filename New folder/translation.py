@@ -1,3 +1,8 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from meaning_parser import iter_pairs
+
 def wc(a,b):
     if len(b)>len(a):b,a=a,b
     for i in range(len(a)):
@@ -22,15 +27,9 @@ text = """dhṛtarāṣṭra—King Dhṛtarāṣṭra; uvāca—said; dharma-k
 text_sample = """dhṛtarāṣṭra—King Dhṛtarāṣṭra; uvāca—said; dharma-kṣetre—in the place of pilgrimage; kuru-kṣetre—in the place named Kurukṣetra; samavetā— assembled; yuyutsava—desiring to fight; māmakā—my party (sons); pāṇḍavā—the sons of Pāṇḍu; ca—and; eva—certainly; kim— what; akurvata— did they do; sañjaya—O Sañjaya; sañjaya—Sañjaya; uvāca—said; dṛṣṭvā—after seeing; tu—but; pāṇḍavaanīkam—the soldiers of the Pāṇḍavas; vyūḍham—arranged in military phalanx; duryodhana—King Duryodhana; tadā—at that time; ācāryam— the teacher; upasaṅgamya—approaching nearby; rājā—the king; vacanam— words; abravīt—spoke"""
 
 #print(text_sample.split("; "))
-tokens = text.split("; ")
 token_dict = {}
-for i in tokens:
-    a = i.split("—")
-    # if len(a)==1:print(a)
-    # print(a)
-    # print(a[0].strip())
-    # print(a[1].strip())
-    token_dict[a[0].strip()] = a[1].strip()
+for pair in iter_pairs(text, on_error=lambda line, column, segment, reason: print(f"Skipping column {column}: {reason}: {segment!r}")):
+    token_dict[pair["token"]] = pair["meaning"]
 
 # print(token_dict)
 # print(len(tokens))
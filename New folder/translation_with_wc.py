@@ -1,21 +1,18 @@
 import google.generativeai as genai
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from meaning_parser import iter_pairs
+from fuzzy_index import PrefixIndex, prefix_similarity
 
 
 def wc(a,b):
-    if len(b)>len(a):b,a=a,b
-    for i in range(len(a)):
-        if b[:len(a)-i] in a:
-            # print(len(b[:len(a)-i]))
-            return((len(b[:len(a)-i])/len(a))*100)
-            # if (len(b[:len(a)-i])/len(a))*100 >= 80:
-            #     return True
-            #     # return(b[:len(a)-i])
-    return False
+    return prefix_similarity(a,b)
 
-def dictcom(dict1,comparable_word):
-    for i in dict1:
-          if wc(i,comparable_word) >= 80:
-               return [i,comparable_word]
+def dictcom(index,comparable_word):
+    match, score = index.get_most_similar(comparable_word, 80)
+    if match:
+        return [match,comparable_word]
     return False
 
 
@@ -25,15 +22,10 @@ text = """dhṛtarāṣṭra—King Dhṛtarāṣṭra; uvāca—said; dharma-k
 text_sample = """dhṛtarāṣṭra—King Dhṛtarāṣṭra; uvāca—said; dharma-kṣetre—in the place of pilgrimage; kuru-kṣetre—in the place named Kurukṣetra; samavetā— assembled; yuyutsava—desiring to fight; māmakā—my party (sons); pāṇḍavā—the sons of Pāṇḍu; ca—and; eva—certainly; kim— what; akurvata— did they do; sañjaya—O Sañjaya; sañjaya—Sañjaya; uvāca—said; dṛṣṭvā—after seeing; tu—but; pāṇḍavaanīkam—the soldiers of the Pāṇḍavas; vyūḍham—arranged in military phalanx; duryodhana—King Duryodhana; tadā—at that time; ācāryam— the teacher; upasaṅgamya—approaching nearby; rājā—the king; vacanam— words; abravīt—spoke"""
 
 #print(text_sample.split("; "))
-tokens = text.split("; ")
 token_dict = {}
-for i in tokens:
-    a = i.split("—")
-    # if len(a)==1:print(a)
-    # print(a)
-    # print(a[0].strip())
-    # print(a[1].strip())
-    token_dict[a[0].strip()] = a[1].strip()
+for pair in iter_pairs(text, on_error=lambda line, column, segment, reason: print(f"Skipping column {column}: {reason}: {segment!r}")):
+    token_dict[pair["token"]] = pair["meaning"]
+token_index = PrefixIndex(token_dict)
 
 # print(token_dict)
 # print(len(tokens))
@@ -53,10 +45,11 @@ for i in shloka_tokens:
         hard_trans_sentence+=" "
         # print(token_dict[i])
     except:
-        matchornot = dictcom(token_dict,i)
+        matchornot = dictcom(token_index,i)
         # print(matchornot)
         if matchornot: 
             token_dict[matchornot[1]] = token_dict[matchornot[0]]
+            token_index.add(matchornot[1])
             hard_trans_sentence+=token_dict[matchornot[0]]
         else:
             hard_translation.append(i)
@@ -1,3 +1,7 @@
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fuzzy_index import PrefixIndex, prefix_similarity
 a = 'pāṇḍavā'
 b = 'pāṇḍavās'
 c = 0
@@ -6,15 +10,7 @@ d = 0
 # print('kuta' in 'kutah')
 
 def wc(a,b):
-    if len(b)>len(a):b,a=a,b
-    for i in range(len(a)):
-        if b[:len(a)-i] in a:
-            # print(len(b[:len(a)-i]))
-            return((len(b[:len(a)-i])/len(a))*100)
-            # if (len(b[:len(a)-i])/len(a))*100 >= 80:
-            #     return True
-            #     # return(b[:len(a)-i])
-    return False
+    return prefix_similarity(a,b)
 
 for i in range(len(a)):
         if b[:len(a)-i] in a:
@@ -24,12 +20,13 @@ for i in range(len(a)):
             # return(b[:len(a)-i])
 print(wc(a,b))
 
-def dictcom(dict1,comparable_word):
-     for i in dict1:
-          if wc(i,comparable_word) > 80:
-               return i
+def dictcom(index,comparable_word):
+     match, score = index.get_most_similar(comparable_word, 80)
+     if match and wc(match,comparable_word) > 80:
+          return match
           
 dict1 = {'dhṛtarāṣṭra': 'King Dhṛtarāṣṭra', 'uvāca': 'said', 'dharma-kṣetre': 'in the place of pilgrimage', 'kuru-kṣetre': 'in the place named Kurukṣetra', 'samavetā': 'assembled', 'yuyutsava': 'desiring to fight', 'māmakā': 'my party (sons)', 'pāṇḍavā': 'the sons of Pāṇḍu', 'ca': 'also', 'eva': 'certainly', 'kim': 'what to speak of', 'akurvata': 'did they do', 'sañjaya': 'Sañjaya', 'dṛṣṭvā': 'after seeing', 'tu': 'but', 'pāṇḍavaanīkam': 'the soldiers of the Pāṇḍavas', 'vyūḍham': 'arranged in military phalanx', 'duryodhana': 'King Duryodhana', 'tadā': 'at that time', 'ācāryam': 'the teacher', 'upasaṅgamya': 'approaching nearby', 'rājā': 'the king', 'vacanam': 'words', 'abravīt': 'spoke', 'paśya': 'just behold', 'etām': 'this', 'pāṇḍu-putrāṇām': 'of the sons of Pāṇḍu', 'ācārya': 'O teacher', 'mahatīm': 'great', 'camūm': 'military force', 'vyūḍhām': 'arranged', 'drupada-putreṇa': 'by the son of Drupada', 'tava': 'your', 'śiṣyeṇa': 'disciple', 'dhīmatā': 'very intelligent', 'atra': 'here', 'śūrā': 'heroes', 'maheṣvāsā': 'mighty bowmen', 'bhīma-arjuna': 'Bhīma and Arjuna', 'samā': 'equal', 'yudhi': 'in the fight', 'yuyudhāna': 'Yuyudhāna', 'virāṭa': 'Virāṭa (the prince who gave shelter to the Pāṇḍavas while they were in disguise)', 'drupada': 'Drupada, the King of Pāñcāla', 'mahāratha': 'great fighter', 'dhṛṣṭaketu': 'Dhṛṣṭaketu', 'cekitāna': 'Cekitāna', 'kāśirāja': 'Kaśirāja', 'vīryavān': 'very powerful', 'purujit': 'Purujit', 'kuntibhoja': 'Kuntibhoja', 'śaibya': 'Śaibya', 'nara-puṅgava': 'heroes in human society', 'yudhāmanyu': 'Yudhāmanyu', 'vikrānta': 'mighty', 'uttamaujā': 'Uttamaujā', 'saubhadra': 'the son of Subhadrā (Abhimanyu)', 'draupadeyā': 'the sons of Draupadī', 'sarve': 'respectively', 'mahā-rathā': 'great chariot fighters', 'asmākam': 'of ours', 'viśiṣṭā': 'especially powerful', 'ye': 'who', 'tān': 'all of them', 'nibodha': 'just take note, be informed', 'dvijottama': 'the best of the brāhmaṇas', 'nāyakā': 'captains', 'mama': 'my', 'sainyasya': 'of the soldiers', 'saṁjñā-artham': 'for information', 'bravīmi': 'I am speaking', 'te': 'all of them', 'bhavān': 'yourself', 'bhīṣma': 'Grandfather Bhīṣma', 'karṇa': 'Karṇa', 'kṛpa': 'Kṛpa', 'samitiñjaya': 'always victorious in battle', 'aśvatthāmā': 'Aśvatthāmā', 'vikarṇa': 'Vikarṇa', 'saumadatti': 'the son of Somadatta', 'tathā': 'as well as', 'anye': 'many others', 'bahava': 'in great numbers', 'mad-arthe': 'for my sake', 'tyakta-jīvitā': 'prepared to risk life', 'nānā': 'many', 'śastra': 'weapons', 'praharaṇā': 'equipped with', 'yuddha': 'battle', 'viśāradā': 'experienced in military science', 'aparyāptam': 'immeasurable', 'tat': 'that', 'balam': 'strength', 'abhirakṣitam': 'carefully protected', 'paryāptam': 'limited', 'idam': 'thus', 'eteṣām': 'of the Pāṇḍavas', 'bhīma': 'by Bhīma', 'ayaneṣu': 'in the strategic points', 'sarveṣu': 'everywhere', 'yathābhāgam': 'as they are differently arranged', 'avasthitā': 'situated', 'bhīṣmam': 'unto Grandfather Bhīṣma', 'abhirakṣantu': 'support may be given', 'bhavanta': 'all of you', 'hi': 'certainly', 'tasya': 'his', 'sañjanayan': 'increasing', 'harṣam': 'cheerfulness', 'kuruvṛddha': 'the grandsire of the Kuru dynasty (Bhīṣma)', 'pitāmaha': 'the grandfather', 'siṁha-nādam': 'roaring sound, like a lion', 'vinadya': 'vibrating', 'uccai': 'very loudly', 'śaṅkham': 'conchshell', 'dadhmau': 'blew', 'pratāpavān': 'the valiant', 'tata': 'thereafter', 'śaṅkhā': 'conchshells', 'bherya': 'bugles', 'paṇava-ānaka': 'trumpets and drums', 'go-mukhā': 'horns', 'sahasā': 'all of a sudden', 'abhyahanyanta': 'being simultaneously sounded', 'sa': 'he', 'śabda': 'combined sound', 'tumula': 'uproarious', 'abhavat': 'became', 'śvetai': 'by white', 'hayai': 'horses', 'yukte': 'being yoked with', 'mahati': 'in the great', 'syandane': 'chariot', 'sthitau': 'so situated', 'mādhava': 'O Kṛṣṇa, husband of the goddess of fortune', 'pāṇḍava': 'the son of Pāṇḍu (Arjuna)', 'divyau': 'transcendental', 'śaṅkhau': 'conchshells', 'pradadhmatu': 'sounded', 'pāñcajanyam': 'the conchshell named Pāñcajanya', 'hṛṣīkeśa': 'Lord Kṛṣṇa', 'devadattam': 'the conchshell named Devadatta', 'dhanañjaya': 'Dhanañjaya (Arjuna, the winner of wealth)', 'pauṇḍram': 'the conch named Pauṇḍram', 'mahā-śaṅkham': 'the terrific conchshell', 'bhīma-karmā': 'one who performs Herculean tasks', 'vṛkodara': 'the voracious eater (Bhīma)', 'anantavijayam': 'the conch named Anantavijaya', 'kuntīputra': 'the son of Kuntī', 'yudhiṣṭhira': 'Yudhiṣṭhira', 'nakula': 'Nakula', 'sahadeva': 'Sahadeva', 'sughoṣa-maṇipuṣpakau': 'the conches named Sughoṣa and Maṇipuṣpaka', 'kāśya': 'the King of Kāśī (Vārāṇasī)', 'parameṣvāsa': 'the great archer', 'śikhaṇḍī': 'Śikhaṇḍī', 'mahā-ratha': 'one who can fight alone against thousands', 'dhṛṣṭadyumna': 'Dhṛṣṭadyumna (the son of King Drupada)', 'sātyaki': 'Sātyaki (the same as Yuyudhāna, the charioteer of Lord Kṛṣṇa)', 'aparājita': 'who were never vanquished before', 'sarvaśa': 'all', 'pṛthivī-pate': 'O King', 'mahā-bāhu': 'greatly armed', 'śaṅkhān': 'conchshells', 'dadhmu': 'blew', 'pṛthak pṛthak': 'each separately', 'ghoṣa': 'vibration', 'dhārtarāṣṭrāṇām': 'of the sons of Dhṛtarāṣṭra', 'hṛdayāni': 'hearts', 'vyadārayat': 'shattered', 'nabha': 'the sky', 'pṛthivīm': 'the surface of the earth', 'abhyanunādayan': 'by resounding', 'atha': 'also', 'vyavasthitān': 'situated', 'dhārtarāṣṭrān': 'the sons of Dhṛtarāṣṭra', 'kapi-dhvaja': 'one whose flag is marked with Hanumān', 'pravṛtte': 'while about to be engaged', 'śastrasampāte': 'the arrows released', 'dhanu': 'bow', 'udyamya': 'after taking up', 'hṛṣīkeśam': 'unto Lord Kṛṣṇa', 'vākyam': 'words', 'āha': 'said', 'mahī-pate': 'O King', 'arjuna': 'Arjuna', 'senayo': 'of the armies', 'ubhayo': 'of both parties', 'madhye': 'in the midst of', 'ratham': 'the chariot', 'sthāpaya': 'please keep', 'me': 'mine', 'acyuta': 'O infallible one', 'yāvat': 'as long as', 'etān': 'all these', 'nirīkṣe': 'may look', 'aham': 'I', 'yoddhu-kāmān': 'desiring to fight', 'avasthitān': 'situated', 'kai': 'with whom', 'mayā': 'by me', 'saha': 'with', 'yoddhavyam': 'to fight with', 'asmin': 'in this', 'raṇa': 'strife', 'samudyame': 'in the attempt', 'yotsyamānān': 'those who will be fighting', 'avekṣe': 'let me see', 'ete': 'they', 'samāgatā': 'assembled', 'dhārtarāṣṭrasya': 'the son of Dhṛtarāṣṭra', 'durbuddhe': 'evil-minded', 'yuddhe': 'in this battlefield', 'priya': 'well', 'cikīrṣava': 'wishing', 'evam': 'thus', 'ukta': 'addressed', 'guḍākeśena': 'by Arjuna', 'bhārata': 'O descendant of Bharata', 'sthāpayitvā': 'by placing', 'rathottamam': 'the finest chariot', 'droṇa': 'the teacher Droṇa', 'pramukhata': 'in the front of', 'sarveṣām': 'all', 'mahīkṣitām': 'chiefs of the world', 'pārtha': 'Arjuna', 'samavetān': 'assembled', 'kurūn': 'all the members of the Kuru dynasty', 'iti': 'thus', 'tatra': 'there', 'apaśyat': 'he could see', 'sthitān': 'standing', 'pitṝn': 'fathers', 'pitāmahān': 'grandfathers', 'ācāryān': 'teachers', 'mātulān': 'maternal uncles', 'bhrātṝn': 'brothers', 'putrān': 'sons', 'pautrān': 'grandsons', 'sakhīn': 'friends', 'suhṛda': 'wellwishers', 'api': 'certainly', 'samīkṣya': 'after seeing', 'kaunteya': 'the son of Kuntī', 'sarvān': 'all kinds of', 'bandhūn': 'relatives', 'kṛpayā': 'by compassion', 'parayā': 'of a high grade', 'āviṣṭa': 'overwhelmed by', 'viṣīdan': 'while lamenting', 'imam': 'all these', 'svajanam': 'kinsmen', 'kṛṣṇa': 'O Kṛṣṇa', 'yuyutsum': 'all in fighting spirit', 'samupasthitam': 'all present', 'sīdanti': 'quivering', 'gātrāṇi': 'limbs of the body', 'mukham': 'mouth', 'pariśuṣyati': 'drying up', 'vepathu': 'trembling of the body', 'śarīre': 'on the body', 'roma-harṣa': 'standing of hair on end', 'jāyate': 'it so becomes', 'gāṇḍīvam': 'the bow of Arjuna', 'sraṁsate': 'is slipping', 'hastāt': 'from the hands', 'tvak': 'skin', 'paridahyate': 'burning', 'na': 'shall not', 'śaknomi': 'am I able', 'avasthātum': 'to stay', 'bhramati': 'forgetting', 'iva': 'as', 'mana': 'mind', 'nimittāni': 'causes', 'paśyāmi': 'I foresee', 'viparītāni': 'just the opposite', 'keśava': 'O killer of the demon Keśī (Kṛṣṇa)', 'śreya': 'good', 'anupaśyāmi': 'do I foresee', 'hatvā': 'by killing', 'āhave': 'in the fight', 'kāṅkṣe': 'do I desire', 'vijayam': 'victory', 'rājyam': 'kingdom', 'sukhāni': 'all happiness', 'rājyena': 'is the kingdom', 'govinda': 'O Kṛṣṇa', 'bhogai': 'enjoyment', 'jīvitena': 'by living', 'vā': 'either', 'yeṣām': 'for whom', 'arthe': 'for the matter of', 'kāṅkṣitam': 'desired', 'bhogā': 'material enjoyment', 'ime': 'these', 'prāṇān': 'lives', 'tyaktvā': 'giving up', 'dhanāni': 'riches', 'ācāryā': 'teachers', 'pitara': 'forefathers', 'putrā': 'sons', 'pitāmahā': 'grandfathers', 'mātulā': 'maternal uncles', 'śvaśurā': 'fathers-in-law', 'pautrā': 'grandsons', 'śyālā': 'brothers-in-law', 'sambandhina': 'relatives', 'hantum': 'to kill', 'icchāmi': 'do I wish', 'ghnata': 'being killed', 'madhusūdana': 'O killer of the demon Madhu (Kṛṣṇa)', 'trailokya': 'of the three worlds', 'rājyasya': 'of the kingdoms', 'heto': 'in exchange', 'nu': 'only', 'mahī-kṛte': 'for the sake of earth', 'nihatya': 'by killing', 'kā': 'what', 'prīti': 'pleasure', 'syāt': 'will there be', 'janārdana': 'O Kṛṣṇa', 'pāpam': 'sins', 'āśrayet': 'must take upon', 'asmān': 'us', 'ātatāyina': 'aggressors', 'tasmāt': 'therefore', 'arhā': 'deserving', 'vayam': 'we', 'svabāndhavān': 'along with friends', 'katham': 'why', 'sukhina': 'happy', 'syāma': 'become', 'yadi': 'even if', 'paśyanti': 'see', 'lobha': 'greed', 'upahata': 'overpowered', 'cetasa': 'the hearts', 'kula-kṣaya': 'the destruction of a dynasty', 'kṛtam': 'by so doing', 'doṣam': 'crime', 'mitra-drohe': 'quarreling with friends', 'pātakam': 'sinful reactions', 'jñeyam': 'know this', 'asmābhi': 'by us', 'pāpāt': 'from sins', 'asmāt': 'ourselves', 'nivartitum': 'to cease', 'prapaśyadbhi': 'by those who can see', 'kula-kṣaye': 'in destroying the family', 'praṇaśyanti': 'becomes vanquished', 'kula-dharmā': 'the family traditions', 'sanātanā': 'eternal', 'dharme': 'in religion', 'naṣṭe': 'being destroyed', 'kulam': 'family', 'kṛtsnam': 'wholesale', 'adharma': 'irreligion', 'abhibhavati': 'transforms', 'uta': 'it is said', 'abhibhavāt': 'having been predominant', 'praduṣyanti': 'become polluted', 'kula-striya': 'family ladies', 'strīṣu': 'of the womanhood', 'duṣṭāsu': 'being so polluted', 'vārṣṇeya': 'O descendant of Vṛṣṇi', 'varṇa-saṅkara': 'unwanted children', 'saṅkara': 'such unwanted children', 'narakāya': 'for hellish life', 'kula-ghnānām': 'of the destroyer of a family', 'kulasya': 'of the family', 'patanti': 'fall down', 'eṣām': 'of them', 'lupta': 'stopped', 'piṇḍa': 'offerings', 'udaka': 'water', 'kriyā': 'performance', 'doṣai': 'by such faults', 'etai': 'all these', 'kārakai': 'by the doers', 'utsādyante': 'causes devastation', 'jāti-dharmā': 'community project', 'kuladharmā': 'family tradition', 'śāśvatā': 'eternal', 'utsanna': 'spoiled', 'kula-dharmāṇām': 'of those who have the family traditions', 'manuṣyāṇām': 'of such men', 'narake': 'in hell', 'niyatam': 'always', 'vāsa': 'residence', 'bhavati': 'it so becomes', 'anuśuśruma': 'I have heard by disciplic succession', 'aha': 'alas', 'bata': 'how strange it is', 'mahat': 'great', 'kartum': 'to perform', 'vyavasitā': 'decided', 'yat': 'so that', 'rājya': 'kingdom', 'sukha-lobhena': 'driven by greed for royal happiness', 'udyatā': 'trying for', 'mām': 'unto me', 'apratīkāram': 'without being resistant', 'aśastram': 'without being fully equipped', 'śastra-pāṇaya': 'those with weapons in hand', 'dhārtarāṣṭrā': 'the sons of Dhṛtarāṣṭra', 'raṇe': 'in the battlefield', 'hanyu': 'may kill', 'kṣemataram': 'better', 'bhavet': 'become', 'uktvā': 'saying', 'saṅkhye': 'in the battlefield', 'ratha': 'chariot', 'upastha': 'situated on', 'upāviśat': 'sat down again', 'visṛjya': 'keeping aside', 'sa-śaram': 'along with arrows', 'cāpam': 'the bow', 'śoka': 'lamentation', 'saṁvigna': 'distressed', 'mānasa': 'within the mind'}
 for i in dict1:print(i)
+index1 = PrefixIndex(dict1)
 
-print(dictcom(dict1,"pāṇḍavāś"))
+print(dictcom(index1,"pāṇḍavāś"))
@@ -0,0 +1,252 @@
+import os
+import asyncio
+import contextlib
+import argparse
+from collections import defaultdict
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from app import SanskritAnalyzer
+from iast import normalize_text
+
+CORPUS_PATH = os.getenv("CORPUS_PATH", "sanskrit_corpus.json")
+MAX_TEXTS_PER_REQUEST = 1000
+
+
+class AnalysisBatcher:
+    """Collects concurrent analyze requests and runs them as one batch.
+
+    Requests arriving within max_wait seconds of each other (up to max_batch
+    texts) are analyzed with a single get_meanings_for_inputs call per
+    threshold, so their unknown words share one fuzzy score matrix. The
+    analysis runs in a worker thread to keep the event loop responsive.
+    """
+
+    def __init__(self, analyzer, max_batch=256, max_wait=0.005):
+        self.analyzer = analyzer
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.batches = 0
+        self.texts = 0
+        self._queue = None
+        self._task = None
+
+    def start(self):
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def analyze(self, texts, threshold):
+        """Return the analysis of each text once its batch has run."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((texts, threshold, future))
+        return await future
+
+    async def _collect(self):
+        """Wait for one request, then gather more until the batch is full or max_wait has passed."""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        text_count = len(batch[0][0])
+        deadline = loop.time() + self.max_wait
+        while text_count < self.max_batch:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                request = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            batch.append(request)
+            text_count += len(request[0])
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            by_threshold = defaultdict(list)
+            for request in batch:
+                by_threshold[request[1]].append(request)
+
+            for threshold, requests in by_threshold.items():
+                try:
+                    await self._analyze_batch(requests, threshold)
+                except Exception as e:
+                    if len(requests) == 1:
+                        self._fail(requests[0], e)
+                        continue
+                    # Re-run each request alone so only the one with the bad input fails
+                    for request in requests:
+                        try:
+                            await self._analyze_batch([request], threshold)
+                        except Exception as request_error:
+                            self._fail(request, request_error)
+
+    @staticmethod
+    def _fail(request, error):
+        future = request[2]
+        if not future.done():
+            future.set_exception(error)
+
+    async def _analyze_batch(self, requests, threshold):
+        """Analyze the texts of several requests in one call and resolve their futures."""
+        texts = [text for request_texts, _, _ in requests for text in request_texts]
+        analyses = await asyncio.to_thread(self.analyzer.get_meanings_for_inputs, texts, threshold)
+        self.batches += 1
+        self.texts += len(texts)
+        offset = 0
+        for request_texts, _, future in requests:
+            if not future.done():
+                future.set_result(analyses[offset:offset + len(request_texts)])
+            offset += len(request_texts)
+
+
+# Loaded once per worker process when the module is imported
+analyzer = SanskritAnalyzer(corpus_file=CORPUS_PATH)
+batcher = AnalysisBatcher(analyzer)
+
+# Shlokas each token appears in, for /search
+shlokas_by_token = defaultdict(list)
+for shloka_entry in analyzer.corpus:
+    for token in dict.fromkeys(normalize_text(token_entry["token"]) for token_entry in shloka_entry.get("tokens", [])):
+        shlokas_by_token[token].append({"shloka_number": shloka_entry["shloka_number"], "shloka": shloka_entry["shloka"]})
+
+
+def error(message, status_code=400):
+    return JSONResponse({"error": message}, status_code=status_code)
+
+
+def parse_threshold(value):
+    """Return the threshold as an int in 0-100, or None if it is invalid."""
+    try:
+        threshold = int(value)
+    except (TypeError, ValueError):
+        return None
+    return threshold if 0 <= threshold <= 100 else None
+
+
+async def health(request):
+    return JSONResponse({
+        "status": "ok",
+        "shlokas": len(analyzer.corpus),
+        "tokens": len(analyzer.token_dict),
+        "batches": batcher.batches,
+        "batched_texts": batcher.texts
+    })
+
+
+async def analyze(request):
+    """POST {"text": ...} or {"texts": [...]}, optional "threshold"; returns word-by-word results."""
+    try:
+        body = await request.json()
+    except ValueError:
+        return error("request body must be JSON")
+    if not isinstance(body, dict):
+        return error("request body must be a JSON object")
+    threshold = parse_threshold(body.get("threshold", 75))
+    if threshold is None:
+        return error("threshold must be an integer between 0 and 100")
+
+    if isinstance(body.get("text"), str):
+        analyses = await batcher.analyze([body["text"]], threshold)
+        return JSONResponse({"results": analyses[0]})
+    texts = body.get("texts")
+    if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+        return error('provide "text" (a string) or "texts" (a list of strings)')
+    if len(texts) > MAX_TEXTS_PER_REQUEST:
+        return error(f"at most {MAX_TEXTS_PER_REQUEST} texts per request")
+    analyses = await batcher.analyze(texts, threshold) if texts else []
+    return JSONResponse({"results": analyses})
+
+
+async def lookup(request):
+    """GET ?token=...&threshold=...; returns the exact or most similar corpus token and its meaning."""
+    token = request.query_params.get("token", "").strip()
+    threshold = parse_threshold(request.query_params.get("threshold", 75))
+    if not token:
+        return error("token is required")
+    if threshold is None:
+        return error("threshold must be an integer between 0 and 100")
+    return JSONResponse(await run_in_threadpool(analyzer.lookup_token, token, threshold))
+
+
+async def search(request):
+    """GET ?q=...&threshold=...&limit=...; returns the matched token and the shlokas it appears in.
+
+    With mode=meaning, returns the tokens and shlokas whose English meanings best match q instead.
+    """
+    query = request.query_params.get("q", "").strip()
+    mode = request.query_params.get("mode", "token")
+    threshold = parse_threshold(request.query_params.get("threshold", 75))
+    try:
+        limit = max(1, min(int(request.query_params.get("limit", 20)), 100))
+    except ValueError:
+        return error("limit must be an integer")
+    if not query:
+        return error("q is required")
+    if mode == "meaning":
+        return JSONResponse(await run_in_threadpool(analyzer.search_meanings, query, limit))
+    if mode != "token":
+        return error('mode must be "token" or "meaning"')
+    if threshold is None:
+        return error("threshold must be an integer between 0 and 100")
+
+    match = await run_in_threadpool(analyzer.lookup_token, query, threshold)
+    matched_token = match["similar_token"] or (match["token"] if match["match_type"] == "exact" else None)
+    shlokas = shlokas_by_token.get(matched_token, []) if matched_token else []
+    return JSONResponse({"match": match, "total": len(shlokas), "shlokas": shlokas[:limit]})
+
+
+async def similar(request):
+    """POST {"text": ..., "k": 5}; returns the corpus shlokas most similar to a whole verse."""
+    try:
+        body = await request.json()
+    except ValueError:
+        return error("request body must be JSON")
+    if not isinstance(body, dict) or not isinstance(body.get("text"), str):
+        return error('provide "text" (a string)')
+    try:
+        k = max(1, min(int(body.get("k", 5)), 50))
+    except (TypeError, ValueError):
+        return error("k must be an integer")
+    return JSONResponse({"shlokas": await run_in_threadpool(analyzer.find_similar_shlokas, body["text"], k)})
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    batcher.start()
+    yield
+    await batcher.stop()
+    analyzer.close()
+
+
+app = Starlette(
+    routes=[
+        Route("/health", health),
+        Route("/analyze", analyze, methods=["POST"]),
+        Route("/lookup", lookup),
+        Route("/search", search),
+        Route("/similar", similar, methods=["POST"])
+    ],
+    lifespan=lifespan
+)
+
+
+def main():
+    import uvicorn
+    parser = argparse.ArgumentParser(description="Serve the Sanskrit analyzer as a JSON API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", 8000)))
+    parser.add_argument("--workers", type=int, default=1, help="server processes, each with its own analyzer")
+    args = parser.parse_args()
+    uvicorn.run("api:app", host=args.host, port=args.port, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
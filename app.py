@@ -1,34 +1,80 @@
 import streamlit as st
+import re
 import json
-from fuzzywuzzy import fuzz
+import asyncio
+import bisect
+import functools
+from fuzzy_index import NgramIndex, best_matches
+from compiled_corpus import load_corpus, iter_shloka_records
+from meaning_index import MeaningIndex
+from shloka_similarity import ShlokaSimilarityIndex
+from iast import normalize_text, fold_key, shadow_key, has_diacritics, build_key_index
+from sandhi import SandhiSplitter
+from stemmer import StemIndex
+from phrases import PhraseMatcher
+from corpus_store import CorpusStore, chapter_of, verse_of, number_sort_key, canonical_number
 import pandas as pd
 import io
 import base64
-import requests
+import hashlib
+from gemini_client import GeminiClient, GeminiError, DEFAULT_BASE_URL
+from translation_cache import TranslationCache
+from translation_store import TranslationStore, normalize_shloka
+from translation_pipeline import split_shlokas, translate_concurrently
 import os
 
 class SanskritAnalyzer:
-    def __init__(self, corpus_data=None, corpus_file=None):
-        """Initialize with either direct corpus data or a file path."""
+    def __init__(self, corpus_data=None, corpus_file=None, index_class=NgramIndex, lookup_cache_size=4096,
+                 shadow_keys=True, sandhi_splitting=True, stem_matching=True):
+        """Initialize with either direct corpus data or a file path.
+
+        index_class picks the fuzzy scorer: NgramIndex (fuzz.ratio) or PrefixIndex (shared prefix).
+        """
+        self.index_class = index_class
+        self.shadow_keys = shadow_keys
+        self.sandhi_splitting = sandhi_splitting
+        self.stem_matching = stem_matching
+        self.lookup_cache_size = lookup_cache_size
         self.corpus = corpus_data if corpus_data else self._load_corpus(corpus_file)
-        self.token_dict = self._build_token_dictionary()
-        
+        self._build_indexes()
+
+    def _build_indexes(self):
+        """Builds every lookup index in one pass over the corpus records (no entry dicts for a compiled corpus)."""
+        records = list(iter_shloka_records(self.corpus))
+        self.token_dict = self._build_token_dictionary(records)
+        self.shloka_index = self._build_shloka_index(records)
+
+    def close(self):
+        """Releases a memory-mapped compiled corpus; the analyzer cannot read shlokas afterwards."""
+        if hasattr(self.corpus, "close"):
+            self.corpus.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def _load_corpus(self, corpus_file):
-        """Load corpus from a JSON file."""
+        """Load corpus from a JSON file, a compiled corpus or a chapter segment directory."""
         try:
-            with open(corpus_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            if os.path.isdir(corpus_file):
+                return CorpusStore(corpus_file).load()
+            return load_corpus(corpus_file)
         except Exception as e:
             st.error(f"Error loading corpus: {e}")
             return []
             
-    def _build_token_dictionary(self):
-        """Creates a flat dictionary mapping tokens to meanings from the corpus."""
+    def _build_token_dictionary(self, records):
+        """Creates a flat dictionary mapping tokens to meanings from the corpus records."""
         token_meaning_dict = {}
-        for shloka_entry in self.corpus:
-            for token_entry in shloka_entry.get("tokens", []):
-                token = token_entry["token"].strip().lower()
-                meaning = token_entry["meaning"].strip()
+        # How often each token is used, to prefer common words when splitting sandhi
+        token_counts = {}
+        for _, _, token_pairs in records:
+            for token, meaning in token_pairs:
+                token = normalize_text(token)
+                meaning = meaning.strip()
+                token_counts[token] = token_counts.get(token, 0) + 1
                 
                 # If token appears multiple times with different meanings,
                 # combine the meanings to provide more context
@@ -38,58 +84,289 @@ class SanskritAnalyzer:
                         token_meaning_dict[token] = f"{existing_meaning}; {meaning}"
                 else:
                     token_meaning_dict[token] = meaning
+
+        # Exact-match indexes on spelling-folded keys (and optionally without
+        # diacritics), so kim/kiṁ or krsna/kṛṣṇa are found without a fuzzy scan
+        self.folded_index = build_key_index(token_meaning_dict, fold_key)
+        self.shadow_index = build_key_index(token_meaning_dict, shadow_key) if self.shadow_keys else {}
+        # Multi-word tokens such as "śrī bhagavān uvāca", matched longest first
+        self.phrase_matcher = PhraseMatcher(token_meaning_dict)
+        # Resolves words joined by sandhi (vyāmiśreṇeva -> vyāmiśreṇa + iva)
+        self.sandhi_splitter = (
+            SandhiSplitter(token_meaning_dict, frequencies=token_counts) if self.sandhi_splitting else None
+        )
+        # Other case endings of a known stem (karmaṇaḥ/karmaṇi -> karma)
+        self.stem_index = StemIndex(token_meaning_dict) if self.stem_matching else None
+
+        # Candidate index for fuzzy lookups, built once per corpus
+        self.fuzzy_index = self.index_class(token_meaning_dict.keys())
+        # Recurring inflected forms are resolved once per threshold; the
+        # cache is rebuilt with the index so it never outlives its corpus
+        self._similar_token_cache = functools.lru_cache(maxsize=self.lookup_cache_size)(
+            self.fuzzy_index.get_most_similar
+        )
+        # Full-text index over the meanings, for searching by English word
+        self.meaning_index = MeaningIndex(token_meaning_dict, (token_pairs for _, _, token_pairs in records))
         return token_meaning_dict
-    
+
+    def _build_shloka_index(self, records):
+        """Builds chapter -> verse -> corpus offset, with chapters and verses in numeric order.
+
+        Also indexes each shloka's normalized text for exact-shloka recognition.
+        """
+        verses_by_chapter = {}
+        self.shloka_text_index = {}
+        for offset, (shloka_number, shloka_text, _) in enumerate(records):
+            chapter, verse = canonical_number(chapter_of(shloka_number)), canonical_number(verse_of(shloka_number))
+            verses_by_chapter.setdefault(chapter, {})[verse] = offset
+            self.shloka_text_index.setdefault(normalize_shloka(shloka_text), (chapter, verse))
+
+        shloka_index = {}
+        # Sorted verse keys per chapter, for bisecting verse ranges
+        self._verse_sort_keys = {}
+        for chapter in sorted(verses_by_chapter, key=number_sort_key):
+            verses = sorted(verses_by_chapter[chapter], key=number_sort_key)
+            shloka_index[chapter] = {verse: verses_by_chapter[chapter][verse] for verse in verses}
+            self._verse_sort_keys[chapter] = [number_sort_key(verse) for verse in verses]
+        # Whole-verse similarity, one row per corpus offset
+        self.shloka_similarity = ShlokaSimilarityIndex(shloka_text for _, shloka_text, _ in records)
+        return shloka_index
+
+    def _verse_offsets(self, chapter=None, start_verse=None, end_verse=None):
+        """Corpus offsets of a chapter's verses from start_verse to end_verse inclusive (all chapters if None)."""
+        if chapter is None:
+            return [offset for verses in self.shloka_index.values() for offset in verses.values()]
+        chapter = canonical_number(chapter)
+        offsets = list(self.shloka_index.get(chapter, {}).values())
+        sort_keys = self._verse_sort_keys.get(chapter, [])
+        low = 0 if start_verse is None else bisect.bisect_left(sort_keys, number_sort_key(str(start_verse).strip()))
+        high = len(offsets) if end_verse is None else bisect.bisect_right(sort_keys, number_sort_key(str(end_verse).strip()))
+        return offsets[low:high]
+
+    def chapters(self):
+        """Return the chapter numbers in the corpus, in order."""
+        return list(self.shloka_index)
+
+    def verses(self, chapter):
+        """Return the verse numbers of a chapter, in order."""
+        return list(self.shloka_index.get(canonical_number(chapter), {}))
+
+    def get_shloka(self, chapter, verse):
+        """Return the shloka entry for a chapter and verse (e.g. 2, 47 or "02", "047"), or None."""
+        offset = self.shloka_index.get(canonical_number(chapter), {}).get(canonical_number(verse))
+        return None if offset is None else self.corpus[offset]
+
+    def get_shlokas(self, chapter, start_verse=None, end_verse=None):
+        """Return a chapter's shloka entries from start_verse to end_verse inclusive, in verse order."""
+        return [self.corpus[offset] for offset in self._verse_offsets(chapter, start_verse, end_verse)]
+
+    def find_shloka(self, text):
+        """Return the corpus shloka whose text matches text exactly (ignoring case and spacing), or None."""
+        location = self.shloka_text_index.get(normalize_shloka(text))
+        return None if location is None else self.get_shloka(*location)
+
+    def find_similar_shlokas(self, text, k=5):
+        """Return the k corpus shlokas most similar to a whole verse, each with its cosine "score" (0-1)."""
+        return [
+            dict(self.corpus[offset], score=round(score, 3))
+            for offset, score in self.shloka_similarity.search(text, k)
+        ]
+
+    def shloka_count(self, chapter=None, start_verse=None, end_verse=None):
+        """Return the number of shlokas in a chapter's verse range, or in the whole corpus."""
+        if chapter is None:
+            return len(self.corpus)
+        return len(self._verse_offsets(chapter, start_verse, end_verse))
+
+    def get_corpus_page(self, chapter=None, page=1, page_size=10, start_verse=None, end_verse=None):
+        """Return (shloka entries on the page, total shlokas) for a chapter's verse range or the whole corpus.
+
+        Only the entries on the requested page are read from the corpus.
+        """
+        offsets = self._verse_offsets(chapter, start_verse, end_verse)
+        start = (page - 1) * page_size
+        return [self.corpus[offset] for offset in offsets[start:start + page_size]], len(offsets)
+
+    def search_meanings(self, query, limit=10):
+        """Ranks tokens and shlokas whose meanings (or Sanskrit tokens) match the query words.
+
+        Returns {"tokens": [{"token", "meaning", "score"}], "shlokas": [{"shloka_number", "shloka", "tokens", "score"}]}.
+        """
+        return {
+            "tokens": [
+                {"token": token, "meaning": self.token_dict[token], "score": round(score, 3)}
+                for token, score in self.meaning_index.search_tokens(query, limit)
+            ],
+            "shlokas": [
+                dict(self.corpus[offset], score=round(score, 3))
+                for offset, score in self.meaning_index.search_shlokas(query, limit)
+            ]
+        }
+
+    def merge_chapters(self, store, chapters=None):
+        """Adds chapters from a CorpusStore that are not loaded yet and rebuilds the token dictionary."""
+        loaded_numbers = {shloka_entry.get("shloka_number") for shloka_entry in self.corpus}
+        new_entries = [
+            shloka_entry for shloka_entry in store.iter_shlokas(chapters)
+            if shloka_entry["shloka_number"] not in loaded_numbers
+        ]
+        if new_entries:
+            corpus = list(self.corpus) + new_entries
+            # The merged corpus is a list, so a memory-mapped one is no longer needed
+            self.close()
+            self.corpus = corpus
+            self._build_indexes()
+        return len(new_entries)
+
     def get_most_similar_token(self, input_token, threshold=75):
         """Find the most similar token from the corpus with similarity ≥ threshold."""
-        input_token = input_token.strip().lower()
-        best_match = None
-        best_score = 0
+        input_token = normalize_text(input_token)
+        return self._similar_token_cache(input_token, threshold)
+
+    def match_normalized(self, token):
+        """Return the corpus token that matches token once spelling is normalized, or None.
+
+        Words typed without diacritics ("krsna") are also looked up ignoring them.
+        """
+        folded_token = self.folded_index.get(fold_key(token))
+        if folded_token or has_diacritics(token):
+            # Diacritics the user typed are kept: mānaḥ is not manaḥ, nor sītā śīta
+            return folded_token
+        return self.shadow_index.get(shadow_key(token))
+
+    def split_sandhi(self, token):
+        """Return the corpus tokens a word joined by sandhi resolves into, or None."""
+        return self.sandhi_splitter.split(token) if self.sandhi_splitter else None
+
+    def match_stem(self, token, threshold=75):
+        """Return (token, similarity) for the closest corpus token with the same stem and similarity ≥ threshold, or (None, 0)."""
+        return self.stem_index.get_most_similar(token, threshold) if self.stem_index else (None, 0)
+
+    def lookup_token(self, token, threshold=75):
+        """Result entry for one word: exact match, normalized spelling, sandhi split, stem, then fuzzy match."""
+        token = normalize_text(token)
+        if token in self.token_dict:
+            return self._token_result(token)
+        normalized_token = self.match_normalized(token)
+        if normalized_token:
+            return self._normalized_result(token, normalized_token)
+        sandhi_tokens = self.split_sandhi(token)
+        if sandhi_tokens:
+            return self._sandhi_result(token, sandhi_tokens)
+        stem_token, similarity = self.match_stem(token, threshold)
+        if stem_token:
+            return self._token_result(token, stem_token, similarity, "stem")
+        return self._token_result(token, *self.get_most_similar_token(token, threshold))
+
+    def _normalized_result(self, token, normalized_token):
+        """Result entry for a word found by match_normalized.
 
-        for token in self.token_dict.keys():
-            score = fuzz.ratio(input_token, token)
-            if score > best_score and score >= threshold:
-                best_match = token
-                best_score = score
+        Anusvāra/visarga spellings are exact; words typed without diacritics
+        are "ascii" matches, as several corpus words can share one ASCII form (matā, mātā).
+        """
+        match_type = "exact" if fold_key(token) == fold_key(normalized_token) else "ascii"
+        return self._token_result(token, normalized_token, 100, match_type)
 
-        return best_match, best_score
+    def _sandhi_result(self, token, sandhi_tokens):
+        """Builds the result entry for a word split into several corpus tokens."""
+        return {
+            "token": token,
+            "meaning": " + ".join(self.token_dict[sandhi_token] for sandhi_token in sandhi_tokens),
+            "match_type": "sandhi",
+            "similar_token": " + ".join(sandhi_tokens),
+            "similarity": 100
+        }
+
+    def _token_result(self, token, similar_token=None, similarity=0, match_type="fuzzy"):
+        """Builds the result entry for one input token."""
+        if token in self.token_dict:
+            return {
+                "token": token,
+                "meaning": self.token_dict[token],
+                "match_type": "exact",
+                "similar_token": None,
+                "similarity": 100
+            }
+        if similar_token:
+            return {
+                "token": token,
+                "meaning": self.token_dict[similar_token],
+                "match_type": match_type,
+                "similar_token": similar_token,
+                "similarity": similarity
+            }
+        return {
+            "token": token,
+            "meaning": "Unknown",
+            "match_type": "none",
+            "similar_token": None,
+            "similarity": 0
+        }
 
     def get_meanings_for_input(self, input_sentence, threshold=75):
         """Finds English meanings for each word in input Sanskrit sentence."""
-        input_tokens = input_sentence.strip().lower().split()
-        results = []
+        input_tokens = normalize_text(input_sentence).split()
+        return [
+            self._phrase_result(words, phrase_token) if phrase_token else self.lookup_token(words[0], threshold)
+            for words, phrase_token in self.phrase_matcher.segments(input_tokens)
+        ]
 
-        for token in input_tokens:
+    def _phrase_result(self, words, phrase_token):
+        """Builds the result entry for consecutive input words matching a multi-word token."""
+        return self._token_result(" ".join(words), phrase_token, 100, "exact")
+
+    def get_meanings_for_inputs(self, input_sentences, threshold=75, workers=-1):
+        """Batch version of get_meanings_for_input for many sentences at once.
+
+        All unknown words across the sentences are fuzzy matched in a single
+        multi-core score matrix instead of one lookup per word (fuzz.ratio
+        indexes only; the prefix scorer looks words up one at a time).
+        """
+        sentence_segments = [
+            list(self.phrase_matcher.segments(normalize_text(sentence).split())) for sentence in input_sentences
+        ]
+        single_words = (words[0] for segments in sentence_segments for words, phrase_token in segments if not phrase_token)
+        normalized_matches = {}
+        sandhi_matches = {}
+        stem_matches = {}
+        unknown_tokens = []
+        for token in dict.fromkeys(single_words):
             if token in self.token_dict:
-                meaning = self.token_dict[token]
-                results.append({
-                    "token": token,
-                    "meaning": meaning,
-                    "match_type": "exact",
-                    "similar_token": None,
-                    "similarity": 100
-                })
+                continue
+            normalized_token = self.match_normalized(token)
+            sandhi_tokens = None if normalized_token else self.split_sandhi(token)
+            if normalized_token:
+                normalized_matches[token] = normalized_token
+            elif sandhi_tokens:
+                sandhi_matches[token] = sandhi_tokens
             else:
-                similar_token, similarity = self.get_most_similar_token(token, threshold)
-                if similar_token:
-                    meaning = self.token_dict[similar_token]
-                    results.append({
-                        "token": token,
-                        "meaning": meaning,
-                        "match_type": "fuzzy",
-                        "similar_token": similar_token,
-                        "similarity": similarity
-                    })
+                stem_token, similarity = self.match_stem(token, threshold)
+                if stem_token:
+                    stem_matches[token] = stem_token, similarity
                 else:
-                    results.append({
-                        "token": token,
-                        "meaning": "Unknown",
-                        "match_type": "none",
-                        "similar_token": None,
-                        "similarity": 0
-                    })
-
-        return results
+                    unknown_tokens.append(token)
+        if self.fuzzy_index.scorer == "ratio":
+            matches = dict(zip(unknown_tokens, best_matches(unknown_tokens, self.token_dict.keys(), threshold, workers)))
+        else:
+            # Other scorers have no score matrix; their lookups are cheap enough one by one
+            matches = {token: self.get_most_similar_token(token, threshold) for token in unknown_tokens}
+
+        def token_result(token):
+            if token in normalized_matches:
+                return self._normalized_result(token, normalized_matches[token])
+            if token in sandhi_matches:
+                return self._sandhi_result(token, sandhi_matches[token])
+            if token in stem_matches:
+                return self._token_result(token, *stem_matches[token], "stem")
+            return self._token_result(token, *matches.get(token, (None, 0)))
+
+        return [
+            [
+                self._phrase_result(words, phrase_token) if phrase_token else token_result(words[0])
+                for words, phrase_token in segments
+            ]
+            for segments in sentence_segments
+        ]
         
     def analyze_shloka(self, shloka_text, threshold=75):
         """Analyzes a complete shloka and returns structured results."""
@@ -100,17 +377,37 @@ class SanskritAnalyzer:
         """Return basic statistics about the corpus."""
         total_shlokas = len(self.corpus)
         total_tokens = len(self.token_dict)
+        cache_info = self._similar_token_cache.cache_info()
         return {
             "total_shlokas": total_shlokas,
-            "total_tokens": total_tokens
+            "total_tokens": total_tokens,
+            "lookup_cache_hits": cache_info.hits,
+            "lookup_cache_misses": cache_info.misses,
+            "lookup_cache_size": cache_info.currsize
         }
 
-def get_gemini_translation(word_meanings, api_key):
-    """Use Gemini API to generate a cohesive translation from word meanings."""
-    try:
-        # Prepare the context and prompt for Gemini
-        context = " ".join(word_meanings)
-        prompt = f"""I have analyzed a Sanskrit shloka, with the following word-by-word translation:
+# Sampling settings for the translation request
+TRANSLATION_GENERATION_CONFIG = {
+    "temperature": 0.2,
+    "topP": 0.8,
+    "topK": 40,
+    "maxOutputTokens": 200
+}
+
+@st.cache_resource
+def get_gemini_client():
+    """Returns one Gemini client per process so its connection pool is reused across reruns and sessions."""
+    # GEMINI_BASE_URL lets the app run against a local stub (see gemini_stub.py)
+    return GeminiClient(
+        model="gemini-2.5-flash",
+        base_url=os.getenv("GEMINI_BASE_URL", DEFAULT_BASE_URL),
+        cache=TranslationCache(os.getenv("TRANSLATION_CACHE_PATH", "translation_cache.sqlite3"))
+    )
+
+def build_translation_prompt(word_meanings):
+    """Builds the Gemini prompt from the word-by-word meanings."""
+    context = " ".join(word_meanings)
+    return f"""I have analyzed a Sanskrit shloka, with the following word-by-word translation:
         
 {context}
 
@@ -118,59 +415,381 @@ Please create a coherent, meaningful English sentence or paragraph that captures
 Maintain the same meaning but make it flow naturally in English. Don't be overly literal - focus on the overall message.
 """
 
-        # Updated Gemini API endpoint for gemini-1.5-pro
-        url = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent"
-        
-        # Request parameters
-        params = {
-            "key": api_key
-        }
-        
-        # Request body
-        data = {
-            "contents": [
-                {
-                    "parts": [
-                        {
-                            "text": prompt
-                        }
-                    ]
-                }
-            ],
-            "generationConfig": {
-                "temperature": 0.2,
-                "topP": 0.8,
-                "topK": 40,
-                "maxOutputTokens": 200
-            }
-        }
-        
-        # Make the request
-        response = requests.post(url, params=params, json=data)
-        
-        # Check if the request was successful
-        if response.status_code == 200:
-            # Parse the response
-            result = response.json()
-            # Extract the generated text from the response
-            if "candidates" in result and len(result["candidates"]) > 0:
-                generated_text = result["candidates"][0]["content"]["parts"][0]["text"]
-                return generated_text
-            else:
-                return "No response text was generated by the API."
-        else:
-            error_message = f"Error with Gemini API: {response.status_code}"
-            try:
-                error_details = response.json()
-                error_message += f" - {error_details}"
-            except:
-                error_message += f" - {response.text}"
-            return error_message
-    
+def get_gemini_translation(word_meanings, api_key, client=None):
+    """Use Gemini API to generate a cohesive translation from word meanings."""
+    client = client or get_gemini_client()
+    try:
+        generated_text = client.generate_text(
+            build_translation_prompt(word_meanings), api_key, TRANSLATION_GENERATION_CONFIG
+        )
+    except GeminiError as e:
+        return str(e)
     except Exception as e:
         return f"Error connecting to Gemini API: {str(e)}"
 
+    if generated_text is None:
+        return "No response text was generated by the API."
+    return generated_text
+
+def stream_gemini_translation(word_meanings, api_key, client=None):
+    """Like get_gemini_translation, but yields the translation so far as each streamed chunk arrives."""
+    client = client or get_gemini_client()
+    generated_text = ""
+    try:
+        for chunk in client.stream_text(build_translation_prompt(word_meanings), api_key, TRANSLATION_GENERATION_CONFIG):
+            generated_text += chunk
+            yield generated_text
+    except GeminiError as e:
+        yield str(e)
+        return
+    except Exception as e:
+        yield f"Error connecting to Gemini API: {str(e)}"
+        return
+
+    if not generated_text:
+        yield "No response text was generated by the API."
+
+def build_word_by_word(analysis_results):
+    """Formats analysis results as word-by-word text and collects the meanings sent to Gemini."""
+    word_by_word = []
+    word_meanings = []  # Store just the meanings for Gemini
+    
+    for result in analysis_results:
+        if result["match_type"] == "exact":
+            word_by_word.append(f"{result['token']} ({result['meaning']})")
+            word_meanings.append(result['meaning'])
+        elif result["match_type"] == "ascii":
+            word_by_word.append(f"{result['token']} ({result['meaning']}) ~{result['similar_token']}")
+            word_meanings.append(result['meaning'])
+        elif result["match_type"] in ("fuzzy", "stem"):
+            word_by_word.append(f"{result['token']} ({result['meaning']}) ~{result['similar_token']} [{result['similarity']}%]")
+            word_meanings.append(result['meaning'])
+        elif result["match_type"] == "sandhi":
+            word_by_word.append(f"{result['token']} = {result['similar_token']} ({result['meaning']})")
+            word_meanings.append(result['meaning'])
+        else:
+            word_by_word.append(f"{result['token']} ([?])")
+            word_meanings.append("[unknown]")
+    return word_by_word, word_meanings
+
+@st.cache_resource
+def get_translation_store():
+    """Loads the precomputed shloka translations once per process (see precompute_translations.py)."""
+    return TranslationStore(os.getenv("TRANSLATION_STORE_PATH", "shloka_translations.json"))
+
+# Example corpus used when no JSON corpus is uploaded
+EXAMPLE_CORPUS_JSON = '''[
+    {
+        "shloka_number": "3.1",
+        "shloka": "arjuna uvāca jyāyasī cet karmaṇas te matā buddhir janārdana tat kiṁ karmaṇi ghore māṁ niyojayasi keśava",
+        "tokens": [
+            {
+                "token": "arjunaḥ",
+                "meaning": "Arjuna"
+            },
+            {
+                "token": "uvāca",
+                "meaning": "said"
+            },
+            {
+                "token": "jyāyasī",
+                "meaning": "speaking very highly"
+            },
+            {
+                "token": "cet",
+                "meaning": "although"
+            },
+            {
+                "token": "karmaṇaḥ",
+                "meaning": "than fruitive action"
+            },
+            {
+                "token": "te",
+                "meaning": "your"
+            },
+            {
+                "token": "matā",
+                "meaning": "opinion"
+            },
+            {
+                "token": "buddhiḥ",
+                "meaning": "intelligence"
+            },
+            {
+                "token": "janārdana",
+                "meaning": "O Kṛṣṇa"
+            },
+            {
+                "token": "tat",
+                "meaning": "therefore"
+            },
+            {
+                "token": "kim",
+                "meaning": "why"
+            },
+            {
+                "token": "karmaṇi",
+                "meaning": "in action"
+            },
+            {
+                "token": "ghore",
+                "meaning": "ghastly"
+            },
+            {
+                "token": "mām",
+                "meaning": "me"
+            },
+            {
+                "token": "niyojayasi",
+                "meaning": "engaging me"
+            },
+            {
+                "token": "keśava",
+                "meaning": "O Kṛṣṇa"
+            }
+        ]
+    },
+    {
+        "shloka_number": "3.2",
+        "shloka": "vyāmiśreṇeva vākyena buddhiṁ mohayasīva me tad ekaṁ vada niścitya yena śreyo 'ham āpnuyām",
+        "tokens": [
+            {
+                "token": "vyāmiśreṇa",
+                "meaning": "by equivocal"
+            },
+            {
+                "token": "iva",
+                "meaning": "as"
+            },
+            {
+                "token": "vākyena",
+                "meaning": "words"
+            },
+            {
+                "token": "buddhim",
+                "meaning": "intelligence"
+            },
+            {
+                "token": "mohayasi",
+                "meaning": "bewildering"
+            },
+            {
+                "token": "iva",
+                "meaning": "as"
+            },
+            {
+                "token": "me",
+                "meaning": "my"
+            },
+            {
+                "token": "tat",
+                "meaning": "therefore"
+            },
+            {
+                "token": "ekam",
+                "meaning": "only one"
+            },
+            {
+                "token": "vada",
+                "meaning": "please tell"
+            },
+            {
+                "token": "niścitya",
+                "meaning": "ascertaining"
+            },
+            {
+                "token": "yena",
+                "meaning": "by which"
+            },
+            {
+                "token": "śreyaḥ",
+                "meaning": "real benefit"
+            },
+            {
+                "token": "aham",
+                "meaning": "I"
+            },
+            {
+                "token": "āpnuyām",
+                "meaning": "may have it"
+            }
+        ]
+    },
+    {
+        "shloka_number": "3.3",
+        "shloka": "śrī-bhagavān uvāca loke 'smin dvi-vidhā niṣṭhā purā proktā mayānagha jñāna-yogena sāṅkhyānāṁ karma-yogena yoginām",
+        "tokens": [
+            {
+                "token": "śrī bhagavān uvāca",
+                "meaning": "the Supreme Personality of Godhead said"
+            },
+            {
+                "token": "loke",
+                "meaning": "in the world"
+            },
+            {
+                "token": "asmin",
+                "meaning": "this"
+            },
+            {
+                "token": "dvi-vidhā",
+                "meaning": "two kinds of"
+            },
+            {
+                "token": "niṣṭhā",
+                "meaning": "faith"
+            },
+            {
+                "token": "purā",
+                "meaning": "formerly"
+            },
+            {
+                "token": "proktā",
+                "meaning": "was said"
+            },
+            {
+                "token": "mayā",
+                "meaning": "by Me"
+            },
+            {
+                "token": "anagha",
+                "meaning": "O sinless one"
+            },
+            {
+                "token": "jñānayogena",
+                "meaning": "by the linking process of knowledge"
+            },
+            {
+                "token": "sāṅkhyānām",
+                "meaning": "of the empiric philosophers"
+            },
+            {
+                "token": "karma-yogena",
+                "meaning": "by the linking process of devotion"
+            },
+            {
+                "token": "yoginām",
+                "meaning": "of the devotees"
+            }
+        ]
+    }
+]'''
+
+EXAMPLE_CORPUS_HASH = hashlib.sha256(EXAMPLE_CORPUS_JSON.encode("utf-8")).hexdigest()
+
+# "2.47", "2:47" or "2 47": chapter and verse of a corpus shloka
+SHLOKA_REFERENCE = re.compile(r"^\s*(\d+)[.:\s]\s*(\d+)\s*$")
+
+# Shorter inputs are phrases rather than verses, so they are not compared with whole shlokas
+SIMILAR_SHLOKA_MIN_WORDS = 4
+
+def corpus_hash(corpus_bytes):
+    """Returns the content hash used as the analyzer cache key."""
+    return hashlib.sha256(corpus_bytes).hexdigest()
+
+@st.cache_resource(show_spinner="Building corpus index...", max_entries=8)
+def load_analyzer(corpus_key, _corpus_json):
+    """Builds one SanskritAnalyzer per corpus content hash, shared across reruns and sessions."""
+    return SanskritAnalyzer(corpus_data=json.loads(_corpus_json))
+
 # UI Functions
+def render_translation(translation, placeholder=None):
+    """Shows a translation in the highlighted translation panel, replacing the placeholder's content if given."""
+    (placeholder or st).markdown(f"""
+    <div style="padding: 1rem; border-radius: 0.5rem; background-color: #f0f0f8; border: 1px solid #6060a0; margin: 1rem 0;">
+        <p style="font-size: 1.1rem; font-style: italic; color: #303030;">{translation}</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+def translate_shlokas(analyzer, shlokas, threshold, api_key, concurrency, tokens_per_minute):
+    """Translates each shloka concurrently and shows every translation as soon as it arrives."""
+    store = get_translation_store()
+    prompts = []
+    placeholders = []
+    
+    for shloka, analysis_results in zip(shlokas, analyzer.get_meanings_for_inputs(shlokas, threshold)):
+        st.markdown(f"**{shloka}**")
+        placeholder = st.empty()
+        precomputed = store.get(shloka)
+        if precomputed:
+            with placeholder.container():
+                st.caption(f"Precomputed translation of shloka {precomputed['shloka_number']}")
+                render_translation(precomputed["translation"])
+        elif api_key:
+            placeholder.info("Translating...")
+            _, word_meanings = build_word_by_word(analysis_results)
+            prompts.append(build_translation_prompt(word_meanings))
+            placeholders.append(placeholder)
+        else:
+            placeholder.warning("Please provide a valid Gemini API key in the sidebar to use the AI translation feature.")
+    
+    async def stream_translations():
+        async for index, translation in translate_concurrently(
+            get_gemini_client(), api_key, prompts, TRANSLATION_GENERATION_CONFIG, concurrency, tokens_per_minute
+        ):
+            with placeholders[index].container():
+                render_translation(translation)
+    
+    if prompts:
+        asyncio.run(stream_translations())
+
+def render_corpus_browser(analyzer):
+    """Shows one page of the corpus at a time, optionally limited to a chapter's verse range."""
+    chapter_col, size_col, page_col = st.columns(3)
+    chapter = chapter_col.selectbox(
+        "Chapter", ["All"] + analyzer.chapters(), format_func=lambda c: "All chapters" if c == "All" else f"Chapter {c}"
+    )
+    chapter = None if chapter == "All" else chapter
+    page_size = size_col.selectbox("Shlokas per page", [10, 25, 50])
+
+    start_verse = end_verse = None
+    verses = analyzer.verses(chapter) if chapter else []
+    if len(verses) > 1:
+        start_verse, end_verse = st.select_slider(
+            "Verses", options=verses, value=(verses[0], verses[-1]), key=f"browse_verses_{chapter}"
+        )
+
+    total = analyzer.shloka_count(chapter, start_verse, end_verse)
+    page_count = max(1, -(-total // page_size))
+    # Keyed by the selection so the page resets when it changes
+    page = page_col.number_input(
+        f"Page (of {page_count})", min_value=1, max_value=page_count, value=1,
+        key=f"browse_page_{chapter}_{start_verse}_{end_verse}_{page_size}"
+    )
+
+    page_entries, _ = analyzer.get_corpus_page(chapter, page, page_size, start_verse, end_verse)
+    first = (page - 1) * page_size
+    st.caption(f"Shlokas {first + 1}-{first + len(page_entries)} of {total}")
+    for shloka_entry in page_entries:
+        render_shloka_tokens(shloka_entry)
+
+def render_meaning_search(analyzer, query, limit=10):
+    """Shows the tokens and shlokas whose meanings best match the query."""
+    matches = analyzer.search_meanings(query, limit)
+    if not matches["tokens"]:
+        st.error(f"No meanings mention '{query}'")
+        return
+    st.write("**Matching words**")
+    st.dataframe(pd.DataFrame(matches["tokens"]), hide_index=True)
+    st.write("**Matching shlokas**")
+    for shloka_entry in matches["shlokas"]:
+        render_shloka_tokens(shloka_entry, f"{shloka_entry['shloka_number']}  {shloka_entry['shloka']}  (score {shloka_entry['score']:.2f})")
+
+def render_similar_shlokas(analyzer, text, k=3, min_score=0.3):
+    """Shows the corpus shlokas most similar to a pasted verse, if any are close."""
+    similar_shlokas = [shloka_entry for shloka_entry in analyzer.find_similar_shlokas(text, k) if shloka_entry["score"] >= min_score]
+    if not similar_shlokas:
+        return
+    best = similar_shlokas[0]
+    st.info(f"Closest corpus shloka: {best['shloka_number']} ({best['score']:.0%} similar)")
+    for shloka_entry in similar_shlokas:
+        render_shloka_tokens(shloka_entry, f"{shloka_entry['shloka_number']}  {shloka_entry['shloka']}  ({shloka_entry['score']:.0%} similar)")
+
+def render_shloka_tokens(shloka_entry, title=None):
+    """Shows a corpus shloka's own token/meaning table in an expander."""
+    with st.expander(title or f"{shloka_entry['shloka_number']}  {shloka_entry['shloka']}"):
+        st.dataframe(pd.DataFrame(shloka_entry.get("tokens", []), columns=["token", "meaning"]), hide_index=True)
+
 def get_table_download_link(df, filename="data.csv", text="Download CSV"):
     """Generates a link allowing the data in a dataframe to be downloaded"""
     csv = df.to_csv(index=False)
@@ -204,6 +823,20 @@ def main():
         type="password"
     )
     st.session_state.gemini_api_key = gemini_api_key
+    gemini_metrics = get_gemini_client().metrics()
+    if gemini_metrics["requests"]:
+        st.sidebar.caption(
+            f"Gemini calls: {gemini_metrics['requests']} ({gemini_metrics['retries']} retries, "
+            f"{gemini_metrics['failures']} failed) | p50 {gemini_metrics['latency_p50']:.2f}s, "
+            f"p95 {gemini_metrics['latency_p95']:.2f}s"
+            + (f" | first words p50 {gemini_metrics['first_chunk_p50']:.2f}s" if "first_chunk_p50" in gemini_metrics else "")
+        )
+    translation_cache_stats = get_gemini_client().cache.stats()
+    if translation_cache_stats["hits"] or translation_cache_stats["misses"]:
+        st.sidebar.caption(
+            f"Translation cache: {translation_cache_stats['hits']} hits / {translation_cache_stats['misses']} misses "
+            f"({translation_cache_stats['entries']} stored)"
+        )
     
     # Option to use uploaded corpus or default
     corpus_source = st.sidebar.radio(
@@ -217,212 +850,21 @@ def main():
         uploaded_file = st.sidebar.file_uploader("Upload Sanskrit corpus (JSON format)", type=["json"])
         if uploaded_file is not None:
             try:
-                corpus_data = json.load(uploaded_file)
-                analyzer = SanskritAnalyzer(corpus_data=corpus_data)
+                corpus_bytes = uploaded_file.getvalue()
+                uploaded_hash = corpus_hash(corpus_bytes)
+                # A new upload replaces this session's previous corpus, so drop
+                # the analyzer built for it instead of keeping it until eviction
+                previous_hash = st.session_state.get("uploaded_corpus_hash")
+                if previous_hash and previous_hash != uploaded_hash:
+                    load_analyzer.clear(previous_hash, None)
+                analyzer = load_analyzer(uploaded_hash, corpus_bytes)
+                st.session_state.uploaded_corpus_hash = uploaded_hash
                 st.sidebar.success("Corpus loaded successfully!")
             except Exception as e:
                 st.sidebar.error(f"Error loading corpus: {e}")
     else:
         # Use the example corpus from paste.txt
-        example_corpus = json.loads(
-            '''[
-                {
-                    "shloka_number": "3.1",
-                    "shloka": "arjuna uvāca jyāyasī cet karmaṇas te matā buddhir janārdana tat kiṁ karmaṇi ghore māṁ niyojayasi keśava",
-                    "tokens": [
-                        {
-                            "token": "arjunaḥ",
-                            "meaning": "Arjuna"
-                        },
-                        {
-                            "token": "uvāca",
-                            "meaning": "said"
-                        },
-                        {
-                            "token": "jyāyasī",
-                            "meaning": "speaking very highly"
-                        },
-                        {
-                            "token": "cet",
-                            "meaning": "although"
-                        },
-                        {
-                            "token": "karmaṇaḥ",
-                            "meaning": "than fruitive action"
-                        },
-                        {
-                            "token": "te",
-                            "meaning": "your"
-                        },
-                        {
-                            "token": "matā",
-                            "meaning": "opinion"
-                        },
-                        {
-                            "token": "buddhiḥ",
-                            "meaning": "intelligence"
-                        },
-                        {
-                            "token": "janārdana",
-                            "meaning": "O Kṛṣṇa"
-                        },
-                        {
-                            "token": "tat",
-                            "meaning": "therefore"
-                        },
-                        {
-                            "token": "kim",
-                            "meaning": "why"
-                        },
-                        {
-                            "token": "karmaṇi",
-                            "meaning": "in action"
-                        },
-                        {
-                            "token": "ghore",
-                            "meaning": "ghastly"
-                        },
-                        {
-                            "token": "mām",
-                            "meaning": "me"
-                        },
-                        {
-                            "token": "niyojayasi",
-                            "meaning": "engaging me"
-                        },
-                        {
-                            "token": "keśava",
-                            "meaning": "O Kṛṣṇa"
-                        }
-                    ]
-                },
-                {
-                    "shloka_number": "3.2",
-                    "shloka": "vyāmiśreṇeva vākyena buddhiṁ mohayasīva me tad ekaṁ vada niścitya yena śreyo 'ham āpnuyām",
-                    "tokens": [
-                        {
-                            "token": "vyāmiśreṇa",
-                            "meaning": "by equivocal"
-                        },
-                        {
-                            "token": "iva",
-                            "meaning": "as"
-                        },
-                        {
-                            "token": "vākyena",
-                            "meaning": "words"
-                        },
-                        {
-                            "token": "buddhim",
-                            "meaning": "intelligence"
-                        },
-                        {
-                            "token": "mohayasi",
-                            "meaning": "bewildering"
-                        },
-                        {
-                            "token": "iva",
-                            "meaning": "as"
-                        },
-                        {
-                            "token": "me",
-                            "meaning": "my"
-                        },
-                        {
-                            "token": "tat",
-                            "meaning": "therefore"
-                        },
-                        {
-                            "token": "ekam",
-                            "meaning": "only one"
-                        },
-                        {
-                            "token": "vada",
-                            "meaning": "please tell"
-                        },
-                        {
-                            "token": "niścitya",
-                            "meaning": "ascertaining"
-                        },
-                        {
-                            "token": "yena",
-                            "meaning": "by which"
-                        },
-                        {
-                            "token": "śreyaḥ",
-                            "meaning": "real benefit"
-                        },
-                        {
-                            "token": "aham",
-                            "meaning": "I"
-                        },
-                        {
-                            "token": "āpnuyām",
-                            "meaning": "may have it"
-                        }
-                    ]
-                },
-                {
-                    "shloka_number": "3.3",
-                    "shloka": "śrī-bhagavān uvāca loke 'smin dvi-vidhā niṣṭhā purā proktā mayānagha jñāna-yogena sāṅkhyānāṁ karma-yogena yoginām",
-                    "tokens": [
-                        {
-                            "token": "śrī bhagavān uvāca",
-                            "meaning": "the Supreme Personality of Godhead said"
-                        },
-                        {
-                            "token": "loke",
-                            "meaning": "in the world"
-                        },
-                        {
-                            "token": "asmin",
-                            "meaning": "this"
-                        },
-                        {
-                            "token": "dvi-vidhā",
-                            "meaning": "two kinds of"
-                        },
-                        {
-                            "token": "niṣṭhā",
-                            "meaning": "faith"
-                        },
-                        {
-                            "token": "purā",
-                            "meaning": "formerly"
-                        },
-                        {
-                            "token": "proktā",
-                            "meaning": "was said"
-                        },
-                        {
-                            "token": "mayā",
-                            "meaning": "by Me"
-                        },
-                        {
-                            "token": "anagha",
-                            "meaning": "O sinless one"
-                        },
-                        {
-                            "token": "jñānayogena",
-                            "meaning": "by the linking process of knowledge"
-                        },
-                        {
-                            "token": "sāṅkhyānām",
-                            "meaning": "of the empiric philosophers"
-                        },
-                        {
-                            "token": "karma-yogena",
-                            "meaning": "by the linking process of devotion"
-                        },
-                        {
-                            "token": "yoginām",
-                            "meaning": "of the devotees"
-                        }
-                    ]
-                }
-            ]'''
-        )
-        analyzer = SanskritAnalyzer(corpus_data=example_corpus)
+        analyzer = load_analyzer(EXAMPLE_CORPUS_HASH, EXAMPLE_CORPUS_JSON)
         st.sidebar.success("Example corpus loaded!")
     
     # Show corpus stats if analyzer is initialized
@@ -430,6 +872,7 @@ def main():
         stats = analyzer.get_corpus_stats()
         st.sidebar.subheader("Corpus Statistics")
         st.sidebar.info(f"Shlokas: {stats['total_shlokas']} | Unique tokens: {stats['total_tokens']}")
+        st.sidebar.caption(f"Fuzzy lookup cache: {stats['lookup_cache_hits']} hits / {stats['lookup_cache_misses']} misses")
         
         # Fuzzy matching threshold
         threshold = st.sidebar.slider(
@@ -440,6 +883,16 @@ def main():
             help="Minimum similarity score (0-100) required for fuzzy matching"
         )
         
+        # Multi-line input is translated shloka by shloka within these limits
+        st.sidebar.subheader("Translation Pipeline")
+        translation_concurrency = st.sidebar.number_input(
+            "Concurrent translation requests", min_value=1, max_value=16, value=4
+        )
+        tokens_per_minute = st.sidebar.number_input(
+            "Token budget per minute", min_value=1000, value=100000, step=1000,
+            help="Estimated prompt and output tokens Gemini may use per minute"
+        )
+        
         # Main content
         tab1, tab2, tab3 = st.tabs(["Analyze Text", "Browse Corpus", "About"])
         
@@ -452,7 +905,7 @@ def main():
             )
             
             if input_type == "Single Line":
-                input_text = st.text_input("Enter Sanskrit words or phrase")
+                input_text = st.text_input("Enter Sanskrit words or phrase", help="Or a shloka reference such as 3.1")
             else:
                 input_text = st.text_area("Enter Sanskrit shloka", height=150)
             
@@ -461,7 +914,23 @@ def main():
             use_gemini = st.checkbox("Generate cohesive translation with Gemini AI", value=True)
             
             if st.button("Analyze"):
+                # A reference such as "2.47" analyzes that corpus shloka
+                reference = SHLOKA_REFERENCE.match(input_text)
+                referenced_shloka = analyzer.get_shloka(*map(int, reference.groups())) if reference else None
+                if referenced_shloka:
+                    input_text = referenced_shloka["shloka"]
+                elif reference:
+                    st.warning(f"Shloka {input_text.strip()} is not in the corpus")
+                    input_text = ""
+
                 if input_text:
+                    recognized_shloka = referenced_shloka or analyzer.find_shloka(input_text)
+                    if recognized_shloka:
+                        st.info(f"Recognized shloka {recognized_shloka['shloka_number']}: {recognized_shloka['shloka']}")
+                        render_shloka_tokens(recognized_shloka, "Word meanings recorded in the corpus for this shloka")
+                    elif len(input_text.split()) >= SIMILAR_SHLOKA_MIN_WORDS:
+                        render_similar_shlokas(analyzer, input_text)
+
                     analysis_results = analyzer.get_meanings_for_input(input_text, threshold)
                     
                     # Display results in a table
@@ -473,6 +942,12 @@ def main():
                             return 'background-color: #d4edda; color: #155724'
                         elif s == 'fuzzy':
                             return 'background-color: #fff3cd; color: #856404'
+                        elif s == 'sandhi':
+                            return 'background-color: #d1ecf1; color: #0c5460'
+                        elif s == 'ascii':
+                            return 'background-color: #d4edda; color: #3c5a2a'
+                        elif s == 'stem':
+                            return 'background-color: #e2e3f3; color: #383d6e'
                         else:
                             return 'background-color: #f8d7da; color: #721c24'
                     
@@ -494,70 +969,76 @@ def main():
                     
                     # Word-by-word translation
                     st.subheader("Word-by-Word Translation:")
-                    word_by_word = []
-                    word_meanings = []  # Store just the meanings for Gemini
-                    
-                    for result in analysis_results:
-                        if result["match_type"] == "exact":
-                            word_by_word.append(f"{result['token']} ({result['meaning']})")
-                            word_meanings.append(result['meaning'])
-                        elif result["match_type"] == "fuzzy":
-                            word_by_word.append(f"{result['token']} ({result['meaning']}) ~{result['similar_token']} [{result['similarity']}%]")
-                            word_meanings.append(result['meaning'])
-                        else:
-                            word_by_word.append(f"{result['token']} ([?])")
-                            word_meanings.append("[unknown]")
+                    word_by_word, word_meanings = build_word_by_word(analysis_results)
                     
                     st.write(" ".join(word_by_word))
                     
+                    # Known corpus shlokas are served from the precomputed store
+                    precomputed = get_translation_store().get(input_text) if use_gemini else None
+                    shlokas = split_shlokas(input_text) if input_type == "Multi-line Shloka" else []
+                    
                     # Get Gemini translation if selected
-                    if use_gemini and st.session_state.gemini_api_key:
-                        with st.spinner("Generating coherent translation with Gemini AI..."):
-                            gemini_translation = get_gemini_translation(word_meanings, st.session_state.gemini_api_key)
-                            
-                            st.subheader("AI-Generated Translation:")
-                            st.markdown(f"""
-                            <div style="padding: 1rem; border-radius: 0.5rem; background-color: #f0f0f8; border: 1px solid #6060a0; margin: 1rem 0;">
-                                <p style="font-size: 1.1rem; font-style: italic; color: #303030;">{gemini_translation}</p>
-                            </div>
-                            """, unsafe_allow_html=True)
+                    if use_gemini and len(shlokas) > 1:
+                        st.subheader("AI-Generated Translation:")
+                        translate_shlokas(
+                            analyzer, shlokas, threshold, st.session_state.gemini_api_key,
+                            translation_concurrency, tokens_per_minute
+                        )
+                    elif precomputed:
+                        st.subheader("AI-Generated Translation:")
+                        st.caption(f"Precomputed translation of shloka {precomputed['shloka_number']}")
+                        render_translation(precomputed["translation"])
+                    elif use_gemini and st.session_state.gemini_api_key:
+                        st.subheader("AI-Generated Translation:")
+                        translation_panel = st.empty()
+                        translation_panel.caption("Generating coherent translation with Gemini AI...")
+                        # Redraw the panel as each chunk streams in, so the first words show up early
+                        for partial_translation in stream_gemini_translation(word_meanings, st.session_state.gemini_api_key):
+                            render_translation(partial_translation, translation_panel)
                     elif use_gemini and not st.session_state.gemini_api_key:
                         st.warning("Please provide a valid Gemini API key in the sidebar to use the AI translation feature.")
                     
                     # Show original input for reference
                     st.subheader("Original Input:")
                     st.write(input_text)
-                else:
+                elif not reference:
                     st.warning("Please enter some Sanskrit text to analyze")
         
         with tab2:
             st.subheader("Browse Corpus")
-            
-            # Show corpus as an expandable tree
-            st.json(analyzer.corpus)
+            render_corpus_browser(analyzer)
             
             # Option to export corpus
             if st.button("Export Corpus as JSON"):
-                corpus_json = json.dumps(analyzer.corpus, indent=2)
+                corpus_json = json.dumps(list(analyzer.corpus), indent=2)
                 b64 = base64.b64encode(corpus_json.encode()).decode()
                 href = f'<a href="data:file/json;base64,{b64}" download="sanskrit_corpus.json">Download Corpus JSON</a>'
                 st.markdown(href, unsafe_allow_html=True)
                 
             # Search within corpus
             st.subheader("Search Corpus")
-            search_term = st.text_input("Enter Sanskrit word to search")
+            search_mode = st.radio("Search by", ["Sanskrit word", "English meaning"], horizontal=True)
+            search_term = st.text_input(
+                "Enter Sanskrit word to search" if search_mode == "Sanskrit word" else "Enter words to find in the meanings"
+            )
             
-            if search_term:
-                exact_match = search_term.lower() in analyzer.token_dict
+            if search_term and search_mode == "English meaning":
+                render_meaning_search(analyzer, search_term)
+            elif search_term:
+                match = analyzer.lookup_token(search_term, threshold)
                 
-                if exact_match:
-                    st.success(f"Exact match found: {search_term} - {analyzer.token_dict[search_term.lower()]}")
+                if match["match_type"] == "exact":
+                    st.success(f"Exact match found: {match['similar_token'] or match['token']} - {match['meaning']}")
+                elif match["match_type"] == "ascii":
+                    st.success(f"Match without diacritics: {match['similar_token']} - {match['meaning']}")
+                elif match["match_type"] == "sandhi":
+                    st.success(f"Sandhi split: {match['similar_token']} - {match['meaning']}")
+                elif match["match_type"] == "stem":
+                    st.warning(f"No exact match. Same stem: {match['similar_token']} ({match['meaning']}) - {match['similarity']}% similar")
+                elif match["match_type"] == "fuzzy":
+                    st.warning(f"No exact match. Similar word: {match['similar_token']} ({match['meaning']}) - {match['similarity']}% similar")
                 else:
-                    similar_token, similarity = analyzer.get_most_similar_token(search_term, threshold)
-                    if similar_token:
-                        st.warning(f"No exact match. Similar word: {similar_token} ({analyzer.token_dict[similar_token]}) - {similarity}% similar")
-                    else:
-                        st.error(f"No matches found for '{search_term}' with threshold {threshold}%")
+                    st.error(f"No matches found for '{search_term}' with threshold {threshold}%")
         
         with tab3:
             st.subheader("About Sanskrit Analyzer")
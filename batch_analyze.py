@@ -0,0 +1,197 @@
+import os
+import csv
+import json
+import time
+import argparse
+import itertools
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from app import SanskritAnalyzer
+
+OUTPUT_FIELDS = ["line_number", "token", "match_type", "similar_token", "similarity", "meaning"]
+OUTPUT_FORMATS = ("csv", "jsonl", "parquet")
+
+# Set in the parent before the pool starts, so forked workers share it copy-on-write
+_analyzer = None
+
+
+def _init_worker(corpus_file):
+    """Worker initializer for platforms without fork: each worker loads its own analyzer."""
+    global _analyzer
+    if _analyzer is None:
+        _analyzer = SanskritAnalyzer(corpus_file=corpus_file)
+
+
+def analyze_lines(job):
+    """Worker: analyze a chunk of (line number, text) pairs into one output row per token."""
+    numbered_lines, threshold = job
+    # Same results as get_meanings_for_input per line, with the chunk's unknown words
+    # matched in one score matrix; workers=1 as the pool already uses every core
+    analyses = _analyzer.get_meanings_for_inputs([line for _, line in numbered_lines], threshold, workers=1)
+    rows = []
+    for (line_number, _), results in zip(numbered_lines, analyses):
+        for result in results:
+            rows.append(dict(result, line_number=line_number))
+    return rows
+
+
+def iter_line_chunks(input_file, chunk_size, threshold):
+    """Stream the input file as jobs of up to chunk_size numbered, non-blank lines."""
+    with open(input_file, "r", encoding="utf-8") as f:
+        numbered_lines = ((line_number, line) for line_number, line in enumerate(f, 1) if line.strip())
+        while True:
+            chunk = list(itertools.islice(numbered_lines, chunk_size))
+            if not chunk:
+                return
+            yield chunk, threshold
+
+
+class CsvWriter:
+    """Writes result rows as CSV with a header line."""
+
+    def __init__(self, path):
+        self.file = open(path, "w", encoding="utf-8", newline="")
+        self.writer = csv.DictWriter(self.file, fieldnames=OUTPUT_FIELDS)
+        self.writer.writeheader()
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+
+    def close(self):
+        self.file.close()
+
+
+class JsonlWriter:
+    """Writes result rows as JSON Lines."""
+
+    def __init__(self, path):
+        self.file = open(path, "w", encoding="utf-8")
+
+    def write(self, rows):
+        for row in rows:
+            self.file.write(json.dumps({field: row[field] for field in OUTPUT_FIELDS}, ensure_ascii=False) + "\n")
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetWriter:
+    """Writes result rows to a Parquet file, one row group per chunk (needs pyarrow)."""
+
+    def __init__(self, path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        self.pa = pa
+        self.schema = pa.schema([
+            ("line_number", pa.int64()),
+            ("token", pa.string()),
+            ("match_type", pa.string()),
+            ("similar_token", pa.string()),
+            ("similarity", pa.int64()),
+            ("meaning", pa.string())
+        ])
+        self.writer = pq.ParquetWriter(path, self.schema)
+
+    def write(self, rows):
+        if rows:
+            self.writer.write_table(self.pa.Table.from_pylist(rows, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+WRITERS = {"csv": CsvWriter, "jsonl": JsonlWriter, "parquet": ParquetWriter}
+
+
+def output_format_of(path):
+    """Guess the output format from the file extension, defaulting to CSV."""
+    extension = os.path.splitext(path)[1].lstrip(".").lower()
+    return extension if extension in OUTPUT_FORMATS else "csv"
+
+
+def analyze_file(input_file, output_file, corpus_file="sanskrit_corpus.json", output_format=None,
+                 threshold=75, workers=None, chunk_size=256, on_progress=None):
+    """Analyze every line of input_file and write one row per token to output_file.
+
+    Lines are read lazily and at most a few chunks per worker are in flight,
+    so memory stays flat however large the input is. Results are written in
+    input order. Returns a dict of throughput stats.
+    """
+    global _analyzer
+    start = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+    if "fork" in multiprocessing.get_all_start_methods():
+        # Load once here; forked workers inherit the analyzer and its index without pickling
+        _analyzer = SanskritAnalyzer(corpus_file=corpus_file)
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"))
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(corpus_file,))
+    load_seconds = time.perf_counter() - start
+
+    writer = WRITERS[output_format or output_format_of(output_file)](output_file)
+    lines = tokens = 0
+    analyze_start = time.perf_counter()
+    try:
+        with pool:
+            pending = deque()
+            for job in iter_line_chunks(input_file, chunk_size, threshold):
+                pending.append((len(job[0]), pool.submit(analyze_lines, job)))
+                if len(pending) < workers * 2:
+                    continue
+                line_count, future = pending.popleft()
+                rows = future.result()
+                writer.write(rows)
+                lines += line_count
+                tokens += len(rows)
+                if on_progress:
+                    on_progress(lines, tokens, time.perf_counter() - analyze_start)
+            while pending:
+                line_count, future = pending.popleft()
+                rows = future.result()
+                writer.write(rows)
+                lines += line_count
+                tokens += len(rows)
+    finally:
+        writer.close()
+        if _analyzer is not None:
+            # Workers have exited, so the parent's memory-mapped corpus can go
+            _analyzer.close()
+            _analyzer = None
+
+    analyze_seconds = time.perf_counter() - analyze_start
+    return {
+        "lines": lines,
+        "tokens": tokens,
+        "load_seconds": load_seconds,
+        "analyze_seconds": analyze_seconds,
+        "lines_per_second": lines / analyze_seconds if analyze_seconds else 0.0,
+        "tokens_per_second": tokens / analyze_seconds if analyze_seconds else 0.0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze a transliterated text file line by line without the UI")
+    parser.add_argument("input", help="text file with one sentence or shloka line per line")
+    parser.add_argument("output", help="results file, one row per token (.csv, .jsonl or .parquet)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, help="output format (default: from the extension)")
+    parser.add_argument("--corpus", default="sanskrit_corpus.json")
+    parser.add_argument("--threshold", type=int, default=75, help="fuzzy matching threshold")
+    parser.add_argument("--workers", type=int, default=None, help="analysis processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=256, help="lines sent to a worker at a time")
+    args = parser.parse_args()
+
+    def report(lines, tokens, seconds):
+        print(f"\r{lines} lines, {tokens} tokens ({lines / seconds:.0f} lines/s)", end="", flush=True)
+
+    stats = analyze_file(
+        args.input, args.output, args.corpus, args.format,
+        args.threshold, args.workers, args.chunk_size, on_progress=report
+    )
+    print(f"\rAnalyzed {stats['lines']} lines, {stats['tokens']} tokens in {stats['analyze_seconds']:.2f}s "
+          f"(corpus loaded in {stats['load_seconds']:.2f}s)")
+    print(f"{stats['lines_per_second']:.0f} lines/s, {stats['tokens_per_second']:.0f} tokens/s -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import json
+import time
+import argparse
+from types import SimpleNamespace
+from fuzzywuzzy import fuzz
+import fuzzy_index
+from fuzzy_index import LinearScanIndex, NgramIndex, best_matches
+
+
+def build_token_list(corpus):
+    """Unique lower-cased corpus tokens in first-seen order, like SanskritAnalyzer."""
+    tokens = {}
+    for shloka_entry in corpus:
+        for token_entry in shloka_entry.get("tokens", []):
+            tokens.setdefault(token_entry["token"].strip().lower(), None)
+    return list(tokens)
+
+
+def out_of_vocabulary_words(corpus, vocabulary, limit):
+    """Words from the shloka texts that need fuzzy matching."""
+    words = []
+    for shloka_entry in corpus:
+        for word in shloka_entry.get("shloka", "").lower().split():
+            if word not in vocabulary:
+                words.append(word)
+    return words[:limit]
+
+
+def run(index, words, threshold):
+    """Return (seconds, fuzz.ratio calls, results) for matching every word."""
+    calls = [0]
+
+    def counting_ratio(a, b):
+        calls[0] += 1
+        return fuzz.ratio(a, b)
+
+    fuzzy_index.fuzz = SimpleNamespace(ratio=counting_ratio)
+    try:
+        start = time.perf_counter()
+        results = [index.get_most_similar(word, threshold) for word in words]
+        elapsed = time.perf_counter() - start
+    finally:
+        fuzzy_index.fuzz = fuzz
+    return elapsed, calls[0], results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fuzzy matching cost vs. threshold")
+    parser.add_argument("--corpus", default="sanskrit_corpus.json")
+    parser.add_argument("--limit", type=int, default=500, help="number of out-of-vocabulary words to match")
+    args = parser.parse_args()
+
+    with open(args.corpus, "r", encoding="utf-8") as f:
+        corpus = json.load(f)
+
+    tokens = build_token_list(corpus)
+    words = out_of_vocabulary_words(corpus, set(tokens), args.limit)
+    indexes = {
+        "linear": LinearScanIndex(tokens),
+        "ngram": NgramIndex(tokens),
+    }
+    print(f"{len(tokens)} corpus tokens, {len(words)} out-of-vocabulary words")
+    print(f"{'threshold':>9} {'index':>7} {'ms/word':>8} {'calls/word':>10} {'matched':>8}")
+
+    for threshold in range(50, 96, 5):
+        baseline = None
+        for name, index in indexes.items():
+            elapsed, calls, results = run(index, words, threshold)
+            if baseline is None:
+                baseline = results
+            elif results != baseline:
+                print(f"WARNING: {name} results differ from linear scan at threshold {threshold}")
+            matched = sum(1 for match, _ in results if match)
+            print(f"{threshold:>9} {name:>7} {1000 * elapsed / len(words):>8.3f} {calls / len(words):>10.1f} {matched:>8}")
+
+        # Vectorized path: every word against every token in one cdist call
+        start = time.perf_counter()
+        results = best_matches(words, tokens, threshold)
+        elapsed = time.perf_counter() - start
+        if results != baseline:
+            print(f"WARNING: batch results differ from linear scan at threshold {threshold}")
+        matched = sum(1 for match, _ in results if match)
+        print(f"{threshold:>9} {'batch':>7} {1000 * elapsed / len(words):>8.3f} {len(tokens):>10.1f} {matched:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import time
+from collections import Counter
+import argparse
+from app import SanskritAnalyzer
+from iast import normalize_text, fold_key
+from sandhi import SandhiSplitter
+from fuzzy_index import best_matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the sandhi splitter on the corpus shloka texts")
+    parser.add_argument("--corpus", default="sanskrit_corpus.json")
+    args = parser.parse_args()
+
+    analyzer = SanskritAnalyzer(corpus_file=args.corpus)
+    # Same token frequencies the analyzer breaks ties with
+    token_counts = Counter(
+        normalize_text(token_entry["token"]) for shloka_entry in analyzer.corpus for token_entry in shloka_entry.get("tokens", [])
+    )
+    build_start = time.perf_counter()
+    splitter = SandhiSplitter(analyzer.token_dict, frequencies=token_counts)
+    build_seconds = time.perf_counter() - build_start
+
+    # Words of the shloka text that are neither corpus tokens nor normalized matches,
+    # checked against the tokens recorded for the same shloka
+    words = []
+    for shloka_entry in analyzer.corpus:
+        expected = {fold_key(token_entry["token"]) for token_entry in shloka_entry.get("tokens", [])}
+        for word in normalize_text(shloka_entry["shloka"]).split():
+            if word not in analyzer.token_dict and not analyzer.match_normalized(word):
+                words.append((word, expected))
+
+    split_start = time.perf_counter()
+    splits = [splitter._split(word) for word, _ in words]
+    split_seconds = time.perf_counter() - split_start
+
+    resolved = [(split, expected) for split, (_, expected) in zip(splits, words) if split]
+    correct = sum(1 for split, expected in resolved if all(fold_key(token) in expected for token in split))
+    print(f"Trie of {len(splitter.tokens)} tokens built in {1000 * build_seconds:.1f} ms")
+    print(f"{len(words)} shloka words are not corpus tokens; {len(resolved)} split ({len(resolved) / len(words):.0%})")
+    print(f"{correct} of {len(resolved)} splits ({correct / len(resolved):.0%}) only use tokens recorded for that shloka")
+    print(f"{1e6 * split_seconds / len(words):.1f} us per word uncached ({len(words) / split_seconds:.0f} words/s)")
+
+    # What fuzzy matching made of the same words before this stage existed
+    split_words = [(word, expected) for split, (word, expected) in zip(splits, words) if split]
+    matches = best_matches([word for word, _ in split_words], analyzer.token_dict.keys())
+    fuzzy_correct = sum(1 for (token, _), (_, expected) in zip(matches, split_words) if token and fold_key(token) in expected)
+    print(f"Fuzzy matching (threshold 75) found a recorded token for {fuzzy_correct} of the same {len(split_words)} words "
+          f"({fuzzy_correct / len(split_words):.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import time
+import argparse
+from app import SanskritAnalyzer
+from iast import normalize_text
+from stemmer import StemIndex, stem
+from fuzzy_index import best_matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the fuzzy lookups the stem index saves on the corpus shloka texts")
+    parser.add_argument("--corpus", default="sanskrit_corpus.json")
+    args = parser.parse_args()
+
+    analyzer = SanskritAnalyzer(corpus_file=args.corpus, stem_matching=False)
+    build_start = time.perf_counter()
+    stem_index = StemIndex(analyzer.token_dict)
+    build_seconds = time.perf_counter() - build_start
+
+    # Words of the shloka text that get past the exact, normalized and sandhi
+    # stages, i.e. the fuzzy lookups made without a stem index
+    words = []
+    for shloka_entry in analyzer.corpus:
+        expected = {stem(token_entry["token"]) for token_entry in shloka_entry.get("tokens", [])}
+        shloka_words = normalize_text(shloka_entry["shloka"]).split()
+        for segment, phrase_token in analyzer.phrase_matcher.segments(shloka_words):
+            word = segment[0]
+            if phrase_token or word in analyzer.token_dict or analyzer.match_normalized(word) or analyzer.split_sandhi(word):
+                continue
+            words.append((word, expected))
+
+    lookup_start = time.perf_counter()
+    stem_matches = [stem_index.get_most_similar(word, 75) for word, _ in words]
+    lookup_seconds = time.perf_counter() - lookup_start
+
+    resolved = [(token, word, expected) for (token, _), (word, expected) in zip(stem_matches, words) if token]
+    print(f"{len(stem_index.stems)} stems over {len(analyzer.token_dict)} tokens, built in {1000 * build_seconds:.1f} ms")
+    print(f"{len(words)} shloka words needed a fuzzy lookup; the stem index (threshold 75) resolves {len(resolved)} "
+          f"({len(resolved) / len(words):.0%}), leaving {len(words) - len(resolved)}")
+    print(f"{1e6 * lookup_seconds / len(words):.1f} us per stem lookup")
+
+    # Agreement at the stem level: a different case ending of a recorded token counts
+    correct = sum(1 for token, _, expected in resolved if stem(token) in expected)
+    matches = best_matches([word for _, word, _ in resolved], analyzer.token_dict.keys())
+    fuzzy_correct = sum(1 for (token, _), (_, _, expected) in zip(matches, resolved) if token and stem(token) in expected)
+    print(f"Stem matches share a recorded token's stem for {correct} of {len(resolved)} words ({correct / len(resolved):.0%}); "
+          f"fuzzy matching (threshold 75) for {fuzzy_correct} ({fuzzy_correct / len(resolved):.0%})")
+
+    fuzzy_start = time.perf_counter()
+    for word, _ in words:
+        analyzer.fuzzy_index.get_most_similar(word, 75)
+    fuzzy_seconds = time.perf_counter() - fuzzy_start
+    print(f"{1e6 * fuzzy_seconds / len(words):.1f} us per fuzzy lookup")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import os
+import re
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from meaning_parser import iter_shloka_entries, print_malformed_pair
+from corpus_store import CorpusStore
+from compiled_corpus import compile_corpus
+
+# chapter3.txt / chapter1_transliteration.txt hold the shlokas,
+# chapter3_meanings.txt / chapter14_meaning.txt the token-meaning lines
+CHAPTER_FILE = re.compile(r"^chapter(\d+)(_transliteration|_meanings?)?\.txt$")
+
+
+def discover_chapter_files(directory):
+    """Map each chapter number to its (shlokas file, meanings file) pair."""
+    shloka_files = {}
+    meaning_files = {}
+    for name in os.listdir(directory):
+        match = CHAPTER_FILE.match(name)
+        if not match:
+            continue
+        chapter, suffix = match.groups()
+        if suffix in ("_meaning", "_meanings"):
+            meaning_files[chapter] = os.path.join(directory, name)
+        else:
+            shloka_files[chapter] = os.path.join(directory, name)
+
+    for chapter in sorted(set(shloka_files) ^ set(meaning_files), key=int):
+        print(f"Warning: chapter {chapter} has no {'meanings' if chapter in shloka_files else 'shlokas'} file, skipping it")
+    return {
+        chapter: (shloka_files[chapter], meaning_files[chapter])
+        for chapter in sorted(set(shloka_files) & set(meaning_files), key=int)
+    }
+
+
+def parse_chapter(job):
+    """Worker: parse one chapter pair and time it."""
+    chapter, shlokas_file, meanings_file = job
+    start = time.perf_counter()
+    malformed = []
+    line_counts = []
+    shloka_entries = list(iter_shloka_entries(
+        chapter, shlokas_file, meanings_file,
+        on_error=lambda *error: malformed.append(error),
+        on_mismatch=lambda *counts: line_counts.extend(counts)
+    ))
+    return {
+        "chapter": chapter,
+        "meanings_file": meanings_file,
+        "entries": shloka_entries,
+        "malformed": malformed,
+        "line_counts": line_counts,
+        "seconds": time.perf_counter() - start
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the corpus from every chapter in a directory")
+    parser.add_argument("--source", default="shlokas text files", help="directory with the chapter text files")
+    parser.add_argument("--output", default="sanskrit_corpus.json", help="JSON corpus to write (replaced)")
+    parser.add_argument("--store", help="also append the chapters to this segment directory")
+    parser.add_argument("--compile", action="store_true", help="also write the compiled .bin corpus")
+    parser.add_argument("--workers", type=int, default=None, help="parser processes (default: CPU count)")
+    args = parser.parse_args()
+
+    total_start = time.perf_counter()
+    chapter_files = discover_chapter_files(args.source)
+    jobs = [(chapter, shlokas_file, meanings_file) for chapter, (shlokas_file, meanings_file) in chapter_files.items()]
+    print(f"Found {len(jobs)} chapters in '{args.source}'")
+
+    parse_start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        # map keeps chapter order, so the corpus comes out sorted by chapter
+        chapters = list(pool.map(parse_chapter, jobs))
+    parse_seconds = time.perf_counter() - parse_start
+
+    corpus = []
+    print(f"{'chapter':>7} {'shlokas':>7} {'tokens':>7} {'ms':>8}")
+    for result in chapters:
+        corpus.extend(result["entries"])
+        token_count = sum(len(entry["tokens"]) for entry in result["entries"])
+        print(f"{result['chapter']:>7} {len(result['entries']):>7} {token_count:>7} {1000 * result['seconds']:>8.1f}")
+        if result["line_counts"]:
+            shloka_count, meaning_count = result["line_counts"]
+            print(f"Warning: chapter {result['chapter']} has {shloka_count} shlokas but {meaning_count} meaning lines")
+        for error in result["malformed"]:
+            print_malformed_pair(result["meanings_file"], *error)
+
+    write_start = time.perf_counter()
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(corpus, f, ensure_ascii=False, indent=4)
+    if args.compile:
+        compile_corpus(corpus, os.path.splitext(args.output)[0] + ".bin", source_file=args.output)
+    if args.store:
+        added, skipped = CorpusStore(args.store).add_shlokas(corpus)
+        print(f"Segment store '{args.store}': {added} added, {skipped} already present")
+    write_seconds = time.perf_counter() - write_start
+
+    total_seconds = time.perf_counter() - total_start
+    print(f"Parsed {len(corpus)} shlokas in {parse_seconds:.3f}s, wrote them in {write_seconds:.3f}s")
+    print(f"Total {total_seconds:.3f}s ({len(corpus) / total_seconds:.0f} shlokas/s) -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,8 @@
 from fuzzywuzzy import fuzz
-import json
+from compiled_corpus import load_corpus
 
 # Load your corpus
-with open("sanskrit_corpus.json", "r", encoding="utf-8") as f:
-    corpus = json.load(f)
+corpus = load_corpus("sanskrit_corpus.json")
 
 def flatten_tokens_from_corpus(corpus):
     """Extract all unique Sanskrit tokens from the corpus."""
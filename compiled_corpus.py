@@ -0,0 +1,256 @@
+import os
+import sys
+import json
+import mmap
+import struct
+import hashlib
+import warnings
+import argparse
+from array import array
+
+# File layout (all integers are little-endian uint32, sections 4-byte aligned):
+#   header        MAGIC, VERSION, string count, shloka count, token count,
+#                 source JSON size (uint64) and SHA-256 (zeros if unknown)
+#   string index  string count + 1 offsets into the string blob
+#   shlokas       per shloka: number string id, text string id
+#   shloka tokens shloka count + 1 offsets into the token table
+#   tokens        per token: token string id, meaning string id
+#   string blob   every distinct string once, UTF-8 encoded
+MAGIC = b"SKC1"
+VERSION = 2
+HEADER = struct.Struct("<4sIIIIQ32s")
+NO_SOURCE = (0, bytes(32))
+
+
+def _uint32_bytes(values):
+    """Pack a sequence of ints as little-endian uint32."""
+    packed = array("I", values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _pad(blob):
+    """Pad a byte string to a multiple of 4 bytes."""
+    return blob + b"\0" * (-len(blob) % 4)
+
+
+def source_signature(source_file):
+    """(size, SHA-256 digest) of a file, recorded in the header to detect a stale compiled copy."""
+    digest = hashlib.sha256()
+    with open(source_file, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return os.path.getsize(source_file), digest.digest()
+
+
+def compile_corpus(corpus, output_file, source_file=None):
+    """Write a corpus (list of shloka dicts) in the compiled format.
+
+    source_file is the JSON the corpus was read from; load_corpus only uses
+    the compiled copy while that file is unchanged.
+    """
+    source_size, source_digest = source_signature(source_file) if source_file else NO_SOURCE
+    string_ids = {}
+    strings = []
+
+    def intern(text):
+        if text not in string_ids:
+            string_ids[text] = len(strings)
+            strings.append(text.encode("utf-8"))
+        return string_ids[text]
+
+    shlokas = []
+    token_offsets = [0]
+    tokens = []
+    for shloka_entry in corpus:
+        shlokas += [intern(shloka_entry.get("shloka_number", "")), intern(shloka_entry.get("shloka", ""))]
+        for token_entry in shloka_entry.get("tokens", []):
+            tokens += [intern(token_entry["token"]), intern(token_entry["meaning"])]
+        token_offsets.append(len(tokens) // 2)
+
+    string_offsets = [0]
+    for encoded in strings:
+        string_offsets.append(string_offsets[-1] + len(encoded))
+
+    with open(output_file, "wb") as f:
+        f.write(HEADER.pack(
+            MAGIC, VERSION, len(strings), len(shlokas) // 2, len(tokens) // 2, source_size, source_digest
+        ))
+        f.write(_uint32_bytes(string_offsets))
+        f.write(_uint32_bytes(shlokas))
+        f.write(_uint32_bytes(token_offsets))
+        f.write(_uint32_bytes(tokens))
+        f.write(_pad(b"".join(strings)))
+
+
+def is_compiled_corpus(corpus_file):
+    """Check whether a file starts with the compiled corpus magic bytes."""
+    with open(corpus_file, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class CompiledCorpus:
+    """Read-only, memory-mapped view of a compiled corpus file.
+
+    Records are decoded on access, so opening the file costs the same no
+    matter how many texts it holds and worker processes share its pages.
+    Iterating yields the same shloka dicts as the JSON corpus, one at a time.
+    """
+
+    def __init__(self, corpus_file):
+        self._file = open(corpus_file, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < HEADER.size:
+            self.close()
+            raise ValueError(f"{corpus_file} is not a version {VERSION} compiled corpus")
+        magic, version, n_strings, n_shlokas, n_tokens, *source = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{corpus_file} is not a version {VERSION} compiled corpus")
+        if sys.byteorder != "little":
+            self.close()
+            raise ValueError("Compiled corpora can only be memory-mapped on little-endian machines")
+
+        view = self._view = memoryview(self._mmap)
+        position = HEADER.size
+
+        def section(count):
+            nonlocal position
+            start = position
+            position += 4 * count
+            return view[start:position].cast("I")
+
+        self._string_offsets = section(n_strings + 1)
+        self._shlokas = section(2 * n_shlokas)
+        self._token_offsets = section(n_shlokas + 1)
+        self._tokens = section(2 * n_tokens)
+        self._blob_start = position
+        self.total_tokens = n_tokens
+        self.source_signature = tuple(source)
+
+    def close(self):
+        """Release the memory map and the underlying file."""
+        for name in ("_string_offsets", "_shlokas", "_token_offsets", "_tokens", "_view"):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self._token_offsets) - 1
+
+    def string(self, string_id):
+        """Decode one entry of the interned string table."""
+        start = self._blob_start + self._string_offsets[string_id]
+        end = self._blob_start + self._string_offsets[string_id + 1]
+        return self._mmap[start:end].decode("utf-8")
+
+    def shloka_number(self, index):
+        """Return the shloka number ("chapter.verse") of one shloka."""
+        return self.string(self._shlokas[2 * index])
+
+    def shloka_text(self, index):
+        """Return the transliterated text of one shloka."""
+        return self.string(self._shlokas[2 * index + 1])
+
+    def tokens(self, index):
+        """Yield (token, meaning) pairs of one shloka."""
+        for position in range(self._token_offsets[index], self._token_offsets[index + 1]):
+            yield self.string(self._tokens[2 * position]), self.string(self._tokens[2 * position + 1])
+
+    def iter_token_pairs(self):
+        """Yield (token, meaning) pairs of the whole corpus in order."""
+        for position in range(self.total_tokens):
+            yield self.string(self._tokens[2 * position]), self.string(self._tokens[2 * position + 1])
+
+    def __getitem__(self, index):
+        """Materialize one shloka as the dict used by the JSON corpus."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("shloka index out of range")
+        return {
+            "shloka_number": self.shloka_number(index),
+            "shloka": self.shloka_text(index),
+            "tokens": [{"token": token, "meaning": meaning} for token, meaning in self.tokens(index)]
+        }
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
+def iter_shloka_records(corpus):
+    """Yield (shloka number, shloka text, [(token, meaning), ...]) for each shloka in order.
+
+    A compiled corpus is read field by field, without building the entry dicts.
+    """
+    if isinstance(corpus, CompiledCorpus):
+        for index in range(len(corpus)):
+            yield corpus.shloka_number(index), corpus.shloka_text(index), list(corpus.tokens(index))
+        return
+    for shloka_entry in corpus:
+        yield (
+            shloka_entry.get("shloka_number", ""),
+            shloka_entry.get("shloka", ""),
+            [(token_entry["token"], token_entry["meaning"]) for token_entry in shloka_entry.get("tokens", [])]
+        )
+
+
+def _open_compiled_copy(compiled_file, corpus_file):
+    """Open the compiled copy of corpus_file if it was compiled from the file's current content, else None."""
+    try:
+        compiled = CompiledCorpus(compiled_file)
+    except ValueError as e:
+        warnings.warn(f"Ignoring {compiled_file}: {e}; recompile it with compiled_corpus.py")
+        return None
+    source_size, source_digest = compiled.source_signature
+    # The size is checked first so most edits are caught without hashing the JSON
+    if source_size != os.path.getsize(corpus_file) or (source_size, source_digest) != source_signature(corpus_file):
+        compiled.close()
+        warnings.warn(f"Ignoring {compiled_file}: it was not compiled from the current {corpus_file}")
+        return None
+    return compiled
+
+
+def load_corpus(corpus_file):
+    """Load a corpus file, memory-mapping it if it is compiled.
+
+    For a JSON corpus, a compiled copy next to it (same name, .bin suffix)
+    is used instead when its header records the JSON's current size and
+    SHA-256, so a copy left stale by a checkout or restore is never served.
+    """
+    if is_compiled_corpus(corpus_file):
+        return CompiledCorpus(corpus_file)
+    compiled_file = os.path.splitext(corpus_file)[0] + ".bin"
+    if os.path.exists(compiled_file):
+        compiled = _open_compiled_copy(compiled_file, corpus_file)
+        if compiled is not None:
+            return compiled
+    with open(corpus_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile a JSON corpus for memory-mapped loading")
+    parser.add_argument("corpus", nargs="?", default="sanskrit_corpus.json")
+    parser.add_argument("output", nargs="?", help="defaults to the corpus name with a .bin suffix")
+    args = parser.parse_args()
+
+    output = args.output or os.path.splitext(args.corpus)[0] + ".bin"
+    with open(args.corpus, "r", encoding="utf-8") as f:
+        corpus = json.load(f)
+    compile_corpus(corpus, output, source_file=args.corpus)
+    print(f"Compiled {len(corpus)} shlokas from {args.corpus} into {output} ({os.path.getsize(output)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
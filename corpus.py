@@ -1,73 +1,77 @@
 import json
 import os
+import argparse
+import functools
+from corpus_store import CorpusStore
+from meaning_parser import iter_pairs, iter_shloka_entries, print_malformed_pair
 
 # Function to parse tokens and meanings from a string
 def parse_tokens_meanings(input_str):
-    pairs = input_str.split(';')
-    tokens_meanings = []
-    for pair in pairs:
-        # Only process if '—' is present
-        if '—' in pair:
-            token, meaning = pair.split('—', 1)
-            tokens_meanings.append({
-                "token": token.strip(),
-                "meaning": meaning.strip()
-            })
-    return tokens_meanings
+    return list(iter_pairs(input_str))
 
-# Modify these file names if you wish to use a different chapter.
-shlokas_file = "chapter1_transliteration.txt"     # File with transliterated shlokas (one per line)
-meanings_file = "chapter1_meaning.txt"   # File with corresponding tokens-meanings (one per line)
-corpus_file = "sanskrit_corpus.json"
+def read_chapter(chapter, shlokas_file, meanings_file):
+    """Streams the shloka entries of one chapter from its shloka and meaning files."""
+    def report_mismatch(shloka_count, meaning_count):
+        print("Warning: The number of shlokas and meanings do not match!")
+        print(f"Number of shlokas read: {shloka_count}, number of meanings read: {meaning_count}")
+        print(f"Processed {min(shloka_count, meaning_count)} pairs.")
 
-# Load existing corpus from JSON if it exists
-if os.path.exists(corpus_file):
-    try:
-        with open(corpus_file, 'r', encoding='utf-8') as file:
-            corpus = json.load(file)
-            if not isinstance(corpus, list):
-                corpus = []
-    except json.JSONDecodeError:
-        corpus = []
-else:
-    corpus = []
+    return iter_shloka_entries(
+        chapter, shlokas_file, meanings_file,
+        on_error=functools.partial(print_malformed_pair, meanings_file),
+        on_mismatch=report_mismatch
+    )
 
-# Input the chapter number (this will be used to generate shloka numbers)
-chapter = input("Enter Chapter number: ").strip()
+def add_to_json_corpus(shloka_entries, corpus_file):
+    """Adds shloka entries to the JSON corpus file, skipping shloka numbers it already has."""
+    # Load existing corpus from JSON if it exists
+    corpus = []
+    if os.path.exists(corpus_file):
+        try:
+            with open(corpus_file, 'r', encoding='utf-8') as file:
+                corpus = json.load(file)
+                if not isinstance(corpus, list):
+                    corpus = []
+        except json.JSONDecodeError:
+            corpus = []
 
-# Read all shlokas from the first text file
-with open(shlokas_file, 'r', encoding='utf-8') as file:
-    shloka_lines = [line.strip() for line in file.readlines()]
+    known_numbers = {entry.get("shloka_number") for entry in corpus}
+    added = skipped = 0
+    for entry in shloka_entries:
+        if entry["shloka_number"] in known_numbers:
+            skipped += 1
+            continue
+        corpus.append(entry)
+        known_numbers.add(entry["shloka_number"])
+        added += 1
 
-# Read all corresponding token-meanings from the second text file
-with open(meanings_file, 'r', encoding='utf-8') as file:
-    meaning_lines = [line.strip() for line in file.readlines()]
+    # Save the updated corpus to the JSON file
+    with open(corpus_file, 'w', encoding='utf-8') as file:
+        json.dump(corpus, file, ensure_ascii=False, indent=4)
+    return added, skipped
 
-# Debug prints: check number of lines read from each file
-print(f"Number of shlokas read: {len(shloka_lines)}")
-print(f"Number of meanings read: {len(meaning_lines)}")
+def main():
+    parser = argparse.ArgumentParser(description="Add one chapter of shlokas to the corpus")
+    parser.add_argument("--chapter", help="chapter number (asked for when omitted)")
+    # Modify these file names if you wish to use a different chapter.
+    parser.add_argument("--shlokas", default="chapter1_transliteration.txt", help="file with transliterated shlokas (one per line)")
+    parser.add_argument("--meanings", default="chapter1_meaning.txt", help="file with corresponding tokens-meanings (one per line)")
+    parser.add_argument("--corpus", default="sanskrit_corpus.json")
+    parser.add_argument("--store", help="append to this chapter segment directory instead of rewriting the JSON corpus")
+    args = parser.parse_args()
 
-# Determine the number of shlokas to process (in case of mismatch)
-num_shlokas = min(len(shloka_lines), len(meaning_lines))
-if len(shloka_lines) != len(meaning_lines):
-    print("Warning: The number of shlokas and meanings do not match!")
-    print(f"Processing {num_shlokas} pairs.")
+    # Input the chapter number (this will be used to generate shloka numbers)
+    chapter = args.chapter or input("Enter Chapter number: ").strip()
+    shloka_entries = read_chapter(chapter, args.shlokas, args.meanings)
 
-# Process each pair and append to the corpus
-for index in range(num_shlokas):
-    shloka = shloka_lines[index]
-    meaning_line = meaning_lines[index]
-    shloka_number = f"{chapter}.{index + 1}"  # Creating shloka number as chapter.line_number
-    tokens_meanings = parse_tokens_meanings(meaning_line)
-    shloka_entry = {
-        "shloka_number": shloka_number,
-        "shloka": shloka,
-        "tokens": tokens_meanings
-    }
-    corpus.append(shloka_entry)
+    if args.store:
+        added, skipped = CorpusStore(args.store).add_shlokas(shloka_entries)
+    else:
+        added, skipped = add_to_json_corpus(shloka_entries, args.corpus)
 
-# Save the updated corpus to the JSON file
-with open(corpus_file, 'w', encoding='utf-8') as file:
-    json.dump(corpus, file, ensure_ascii=False, indent=4)
+    if skipped:
+        print(f"Skipped {skipped} shlokas already in the corpus.")
+    print(f"Chapter {chapter} added successfully with {added} shlokas!")
 
-print(f"Chapter {chapter} added successfully with {num_shlokas} shlokas!")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
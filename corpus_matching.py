@@ -1,8 +1,7 @@
-import json
+from compiled_corpus import load_corpus
 
 # Assuming 'corpus' is your list of shlokas like the one you've provided
-with open("sanskrit_corpus.json", "r", encoding="utf-8") as f:
-    corpus = json.load(f)
+corpus = load_corpus("sanskrit_corpus.json")
 
 def build_token_dictionary(corpus):
     """Creates a flat dictionary from token to meaning from the full corpus."""
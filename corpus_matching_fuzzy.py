@@ -1,9 +1,8 @@
-import json
+from compiled_corpus import load_corpus
 from fuzzywuzzy import fuzz
 
 # Load the corpus
-with open("sanskrit_corpus.json", "r", encoding="utf-8") as f:
-    corpus = json.load(f)
+corpus = load_corpus("sanskrit_corpus.json")
 
 def build_token_dictionary(corpus):
     """Creates a flat dictionary from token to meaning from the full corpus."""
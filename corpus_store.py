@@ -0,0 +1,106 @@
+import os
+import json
+
+SEGMENT_PREFIX = "chapter_"
+SEGMENT_SUFFIX = ".jsonl"
+
+
+def chapter_of(shloka_number):
+    """Return the chapter part of a shloka number such as "3.1"."""
+    return shloka_number.split(".", 1)[0].strip()
+
+
+def verse_of(shloka_number):
+    """Return the verse part of a shloka number such as "3.1" ("" if it has none)."""
+    parts = shloka_number.split(".", 1)
+    return parts[1].strip() if len(parts) > 1 else ""
+
+
+def canonical_number(number):
+    """Return a chapter or verse number without leading zeros ("047" -> "47"); others are only stripped."""
+    number = str(number).strip()
+    return str(int(number)) if number.isdigit() else number
+
+
+def number_sort_key(number):
+    """Sort numeric chapters or verses numerically and any others after them."""
+    return (0, int(number), "") if number.isdigit() else (1, 0, number)
+
+
+class CorpusStore:
+    """Chapter-partitioned corpus stored as one JSON Lines segment per chapter.
+
+    Adding shlokas appends to the segment of their chapter only, and entries
+    whose shloka_number is already stored are skipped, so re-running an
+    ingestion never duplicates a chapter. Segments are read on demand.
+    """
+
+    def __init__(self, directory="corpus_segments"):
+        self.directory = directory
+
+    def segment_path(self, chapter):
+        """Path of the JSON Lines segment holding one chapter."""
+        return os.path.join(self.directory, f"{SEGMENT_PREFIX}{chapter}{SEGMENT_SUFFIX}")
+
+    def chapters(self):
+        """List the stored chapters in numeric order."""
+        if not os.path.isdir(self.directory):
+            return []
+        chapters = [
+            name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]
+            for name in os.listdir(self.directory)
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)
+        ]
+        return sorted(chapters, key=number_sort_key)
+
+    def iter_segment(self, chapter):
+        """Yield the shloka entries of one chapter, one line at a time."""
+        path = self.segment_path(chapter)
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def iter_shlokas(self, chapters=None):
+        """Yield shloka entries of the given chapters (default: all), segment by segment."""
+        for chapter in chapters if chapters is not None else self.chapters():
+            yield from self.iter_segment(chapter)
+
+    def load(self, chapters=None):
+        """Merge the given chapters (default: all) into a corpus list."""
+        return list(self.iter_shlokas(chapters))
+
+    def add_shlokas(self, shloka_entries):
+        """Append shloka entries to their chapter segments.
+
+        Returns (added, skipped) counts; entries whose shloka_number is
+        already in the store, or earlier in the same batch, are skipped.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        known_numbers = {}
+        segments = {}
+        added = skipped = 0
+        try:
+            for shloka_entry in shloka_entries:
+                chapter = chapter_of(shloka_entry["shloka_number"])
+                if chapter not in known_numbers:
+                    known_numbers[chapter] = {entry["shloka_number"] for entry in self.iter_segment(chapter)}
+                if shloka_entry["shloka_number"] in known_numbers[chapter]:
+                    skipped += 1
+                    continue
+                if chapter not in segments:
+                    segments[chapter] = open(self.segment_path(chapter), "a", encoding="utf-8")
+                segments[chapter].write(json.dumps(shloka_entry, ensure_ascii=False) + "\n")
+                known_numbers[chapter].add(shloka_entry["shloka_number"])
+                added += 1
+        finally:
+            for segment in segments.values():
+                segment.close()
+        return added, skipped
+
+    def import_corpus(self, corpus_file):
+        """Split an existing JSON corpus file into chapter segments."""
+        with open(corpus_file, "r", encoding="utf-8") as f:
+            return self.add_shlokas(json.load(f))
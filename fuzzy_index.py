@@ -0,0 +1,248 @@
+from collections import defaultdict
+import numpy as np
+from fuzzywuzzy import fuzz
+from rapidfuzz import process
+from rapidfuzz.distance import Indel
+
+
+def _ngrams(text, n=2):
+    """Return a dict of padded character n-grams and their counts."""
+    padded = "\x02" * (n - 1) + text + "\x03" * (n - 1)
+    grams = defaultdict(int)
+    for i in range(len(padded) - n + 1):
+        grams[padded[i:i + n]] += 1
+    return grams
+
+
+def _score_upper_bound(query_len, token_len, shared_grams=None, n=2):
+    """Best fuzz.ratio score a token can reach given its length and shared n-grams.
+
+    fuzz.ratio is 100 * (1 - d / (len1 + len2)) where d is the insert/delete
+    distance. d is at least the length difference, and every insert or delete
+    destroys at most n of the padded n-grams, so few shared n-grams also
+    force a large d. Without shared_grams only the length bound is used.
+    """
+    total = query_len + token_len
+    if total == 0:
+        return 0
+    min_distance = abs(query_len - token_len)
+    if shared_grams is not None:
+        longest = max(query_len, token_len)
+        min_distance = max(min_distance, -(-(longest + n - 1 - shared_grams) // n))
+    # d = len1 + len2 - 2 * LCS, so it always has the parity of the total length
+    if (total - min_distance) % 2:
+        min_distance += 1
+    return int(round(100 * (1 - min_distance / total)))
+
+
+def _length_buckets(tokens):
+    """Group token ids by token length, keeping ids in corpus order."""
+    buckets = defaultdict(list)
+    for token_id, token in enumerate(tokens):
+        buckets[len(token)].append(token_id)
+    return dict(buckets)
+
+
+def _reachable_lengths(buckets, query_len, threshold):
+    """Token lengths whose length difference alone does not rule out threshold."""
+    return [length for length in buckets if _score_upper_bound(query_len, length) >= threshold]
+
+
+def prefix_similarity(a, b):
+    """Length of the prefix a and b share as a percentage of the longer one (pāṇḍavā/pāṇḍavāś: 87.5)."""
+    longest = max(len(a), len(b))
+    if longest == 0:
+        return 0
+    shared = 0
+    for char_a, char_b in zip(a, b):
+        if char_a != char_b:
+            break
+        shared += 1
+    return 100 * shared / longest
+
+
+class LinearScanIndex:
+    """Scores the query against every token that is not ruled out by its length."""
+
+    scorer = "ratio"
+
+    def __init__(self, tokens):
+        self.tokens = list(tokens)
+        self.buckets = _length_buckets(self.tokens)
+
+    def get_most_similar(self, input_token, threshold=75):
+        """Find the most similar token with similarity ≥ threshold."""
+        best_match = None
+        best_score = 0
+        best_id = -1
+
+        for length in _reachable_lengths(self.buckets, len(input_token), threshold):
+            for token_id in self.buckets[length]:
+                token = self.tokens[token_id]
+                score = fuzz.ratio(input_token, token)
+                if score >= threshold and (score > best_score or (score == best_score and token_id < best_id)):
+                    best_match = token
+                    best_score = score
+                    best_id = token_id
+            # Tokens are unique, so nothing else can match the query itself
+            if best_match == input_token:
+                break
+
+        return best_match, best_score
+
+
+class NgramIndex:
+    """Character n-gram inverted index that only scores promising tokens.
+
+    Every token gets an upper bound on its fuzz.ratio score from the n-grams
+    it shares with the query. Tokens are scored best bound first and the
+    search stops once no remaining token can beat the current best, so the
+    result is the same as LinearScanIndex, including which token wins a tie.
+    """
+
+    scorer = "ratio"
+
+    def __init__(self, tokens, n=2):
+        self.n = n
+        self.tokens = list(tokens)
+        self.buckets = _length_buckets(self.tokens)
+        # Postings are split by token length so lookups can skip whole
+        # lengths that cannot reach the threshold
+        self.postings = {length: defaultdict(list) for length in self.buckets}
+        for length, token_ids in self.buckets.items():
+            for token_id in token_ids:
+                for gram, count in _ngrams(self.tokens[token_id], n).items():
+                    self.postings[length][gram].append((token_id, count))
+
+    def _shared_gram_counts(self, query_grams, length):
+        """Count the n-grams each token of the given length shares with the query."""
+        postings = self.postings[length]
+        shared = defaultdict(int)
+        for gram, query_count in query_grams.items():
+            for token_id, token_count in postings.get(gram, ()):
+                shared[token_id] += min(query_count, token_count)
+        return shared
+
+    def _candidates(self, input_token, threshold):
+        """Return (-upper_bound, token_id) pairs that could reach threshold, best first."""
+        query_len = len(input_token)
+        query_grams = _ngrams(input_token, self.n)
+        candidates = []
+        for length in _reachable_lengths(self.buckets, query_len, threshold):
+            shared = self._shared_gram_counts(query_grams, length)
+            for token_id, shared_grams in shared.items():
+                bound = _score_upper_bound(query_len, length, shared_grams, self.n)
+                if bound >= threshold:
+                    candidates.append((-bound, token_id))
+            # Tokens sharing no n-gram all have the same bound, so they only
+            # need visiting when that bound still reaches the threshold
+            bound = _score_upper_bound(query_len, length, 0, self.n)
+            if bound >= threshold:
+                candidates.extend((-bound, token_id) for token_id in self.buckets[length] if token_id not in shared)
+        candidates.sort()
+        return candidates
+
+    def get_most_similar(self, input_token, threshold=75):
+        """Find the most similar token with similarity ≥ threshold."""
+        best_match = None
+        best_score = 0
+        best_id = -1
+
+        for negative_bound, token_id in self._candidates(input_token, threshold):
+            bound = -negative_bound
+            # A later token can only win with a higher score, or an equal one
+            # from earlier in the corpus (the linear scan keeps the first best)
+            if best_match is not None and (bound < best_score or (bound == best_score and token_id > best_id)):
+                break
+            token = self.tokens[token_id]
+            score = fuzz.ratio(input_token, token)
+            if score >= threshold and (score > best_score or (score == best_score and token_id < best_id)):
+                best_match = token
+                best_score = score
+                best_id = token_id
+
+        return best_match, best_score
+
+
+class PrefixIndex:
+    """Best token by prefix_similarity, found in one walk down a character trie.
+
+    Every trie node keeps the shortest token below it (the first one in
+    corpus order on a tie). A token sharing d characters with the query
+    scores at most d / max(len(query), len(token)), and the shortest token
+    under the query's depth-d node shares at least those d characters, so
+    the best token is the best of these per-depth candidates. A lookup is
+    O(len(query)) whatever the number of tokens; on equal scores the token
+    sharing the longer prefix wins. Tokens are ranked and the threshold is
+    applied on the unrounded score; the reported score is rounded.
+    """
+
+    scorer = "prefix"
+
+    def __init__(self, tokens):
+        self.tokens = []
+        self.root = {}
+        for token in tokens:
+            self.add(token)
+
+    def add(self, token):
+        """Index one more token; it loses ties to the tokens added before it."""
+        self.tokens.append(token)
+        node = self.root
+        for char in token:
+            node = node.setdefault(char, {})
+            shortest = node.get(None)
+            if shortest is None or len(token) < len(shortest):
+                node[None] = token
+
+    def get_most_similar(self, input_token, threshold=80):
+        """Find the token with the highest prefix_similarity ≥ threshold."""
+        best_match = None
+        best_score = 0
+        node = self.root
+        for depth, char in enumerate(input_token, 1):
+            node = node.get(char)
+            if node is None:
+                break
+            token = node[None]
+            score = 100 * depth / max(len(input_token), len(token))
+            if score >= threshold and score >= best_score:
+                best_match = token
+                best_score = score
+        return best_match, int(round(best_score))
+
+
+def score_matrix(queries, tokens, workers=-1):
+    """Return an integer matrix of fuzz.ratio scores, one row per query.
+
+    Uses rapidfuzz's cdist across `workers` cores (-1 means all). The indel
+    similarity it computes is the one python-Levenshtein gives fuzzywuzzy,
+    and np.rint rounds halves to even like round(), so every cell equals
+    fuzz.ratio(query, token).
+    """
+    similarity = process.cdist(queries, tokens, scorer=Indel.normalized_similarity, dtype=np.float64, workers=workers)
+    return np.rint(100 * similarity).astype(np.int32)
+
+
+def best_matches(queries, tokens, threshold=75, workers=-1, chunk_size=1024):
+    """Find the most similar token for every query in one vectorized pass.
+
+    Returns a list of (best_match, best_score) pairs in query order, the same
+    as calling get_most_similar on each query. Queries are scored in chunks
+    so the score matrix stays bounded for very large batches.
+    """
+    tokens = list(tokens)
+    results = []
+    if not tokens:
+        return [(None, 0) for _ in queries]
+    for start in range(0, len(queries), chunk_size):
+        scores = score_matrix(queries[start:start + chunk_size], tokens, workers)
+        # argmax returns the first maximum, the token a linear scan keeps
+        best_ids = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(best_ids)), best_ids]
+        for token_id, score in zip(best_ids, best_scores):
+            if score >= threshold and score > 0:
+                results.append((tokens[token_id], int(score)))
+            else:
+                results.append((None, 0))
+    return results
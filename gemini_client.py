@@ -0,0 +1,244 @@
+import json
+import time
+import threading
+from collections import deque
+import requests
+from requests.adapters import HTTPAdapter
+from translation_cache import make_cache_key
+
+DEFAULT_BASE_URL = "https://generativelanguage.googleapis.com/v1beta"
+DEFAULT_MODEL = "gemini-2.5-flash"
+# Rate limiting and transient server errors are worth another attempt
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class GeminiError(Exception):
+    """Raised when the Gemini API cannot be reached or returns an error."""
+
+
+class GeminiAPIError(GeminiError):
+    """Non-retryable (or retried out) error response from the Gemini API."""
+
+    def __init__(self, status_code, details):
+        super().__init__(f"Error with Gemini API: {status_code} - {details}")
+        self.status_code = status_code
+        self.details = details
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls evenly to at most `per_minute` a minute."""
+
+    def __init__(self, per_minute):
+        self.interval = 60.0 / per_minute if per_minute else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def acquire(self):
+        """Block until the caller may make its next call."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class GeminiClient:
+    """Reusable Gemini REST client.
+
+    Keeps a pooled keep-alive requests.Session, bounds every call with
+    connect/read timeouts, retries 429/5xx responses and connection errors
+    with exponential backoff, and records call latencies for metrics().
+    A Retry-After longer than max_retry_delay (default: read_timeout) is
+    not waited for; the 429/5xx response is returned instead. total_timeout
+    bounds a whole call, attempts and waits included: no retry is started
+    that could not finish before it.
+    base_url can point at a local stub server for testing. With a cache
+    (see translation_cache.TranslationCache), generate_text answers repeated
+    prompts without calling the API.
+    """
+
+    def __init__(self, model=DEFAULT_MODEL, base_url=DEFAULT_BASE_URL, connect_timeout=5, read_timeout=60,
+                 max_retries=3, backoff_factor=0.5, pool_size=10, latency_window=1000, cache=None, max_retry_delay=None,
+                 total_timeout=90):
+        self.model = model
+        self.cache = cache
+        self.base_url = base_url.rstrip("/")
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_retry_delay = read_timeout if max_retry_delay is None else max_retry_delay
+        self.total_timeout = total_timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=latency_window)
+        self._first_chunk_latencies = deque(maxlen=latency_window)
+        self._counters = {"requests": 0, "attempts": 0, "retries": 0, "failures": 0}
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
+
+    def _endpoint(self, method):
+        return f"{self.base_url}/models/{self.model}:{method}"
+
+    def _backoff_delay(self, attempt, response=None):
+        """Seconds to wait before the next attempt, honouring Retry-After when sent."""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return float(retry_after)
+        return self.backoff_factor * (2 ** attempt)
+
+    @staticmethod
+    def _can_retry(delay, deadline):
+        """True if another attempt can start after waiting delay seconds, before the deadline."""
+        return time.perf_counter() + delay < deadline
+
+    def _count(self, counter):
+        with self._lock:
+            self._counters[counter] += 1
+
+    def post(self, method, api_key, body, params=None, **kwargs):
+        """POST to a model method with timeouts and retries; returns the final response.
+
+        Raises GeminiError if the API could not be reached on any attempt.
+        """
+        start = time.perf_counter()
+        deadline = start + self.total_timeout
+        self._count("requests")
+        try:
+            for attempt in range(self.max_retries + 1):
+                self._count("attempts")
+                last_attempt = attempt == self.max_retries
+                # Attempts never outlive the deadline (sleep may overshoot it slightly)
+                remaining = max(deadline - time.perf_counter(), 0.01)
+                timeout = tuple(min(limit, remaining) for limit in self.timeout)
+                try:
+                    # The key goes in a header: requests puts the URL, query string included, in its error messages
+                    response = self.session.post(
+                        self._endpoint(method), params=params, headers={"x-goog-api-key": api_key}, json=body,
+                        timeout=timeout, **kwargs
+                    )
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    delay = self._backoff_delay(attempt)
+                    if last_attempt or not self._can_retry(delay, deadline):
+                        self._count("failures")
+                        raise GeminiError(f"Error connecting to Gemini API: {e}") from e
+                    self._count("retries")
+                    time.sleep(delay)
+                    continue
+
+                if response.status_code in RETRY_STATUSES and not last_attempt:
+                    delay = self._backoff_delay(attempt, response)
+                    if delay <= self.max_retry_delay and self._can_retry(delay, deadline):
+                        self._count("retries")
+                        response.close()
+                        time.sleep(delay)
+                        continue
+                if response.status_code != 200:
+                    self._count("failures")
+                return response
+        finally:
+            with self._lock:
+                self._latencies.append(time.perf_counter() - start)
+
+    def generate_content(self, api_key, body):
+        """Call generateContent and return the parsed JSON response."""
+        response = self.post("generateContent", api_key, body)
+        if response.status_code != 200:
+            try:
+                details = response.json()
+            except ValueError:
+                details = response.text
+            raise GeminiAPIError(response.status_code, details)
+        return response.json()
+
+    def generate_text(self, prompt, api_key, generation_config=None):
+        """Generate text for a single prompt; returns None if no candidate came back."""
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(prompt, self.model, generation_config)
+            cached_text = self.cache.get(cache_key)
+            if cached_text is not None:
+                return cached_text
+
+        body = {"contents": [{"parts": [{"text": prompt}]}]}
+        if generation_config:
+            body["generationConfig"] = generation_config
+        result = self.generate_content(api_key, body)
+        if "candidates" in result and len(result["candidates"]) > 0:
+            generated_text = result["candidates"][0]["content"]["parts"][0]["text"]
+            if cache_key is not None:
+                self.cache.set(cache_key, generated_text)
+            return generated_text
+        return None
+
+    def stream_text(self, prompt, api_key, generation_config=None):
+        """Generate text with streamGenerateContent, yielding text chunks as the server sends them.
+
+        Reads the server-sent event stream (alt=sse). A cached translation is
+        yielded as a single chunk; a completed stream is added to the cache.
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(prompt, self.model, generation_config)
+            cached_text = self.cache.get(cache_key)
+            if cached_text is not None:
+                yield cached_text
+                return
+
+        body = {"contents": [{"parts": [{"text": prompt}]}]}
+        if generation_config:
+            body["generationConfig"] = generation_config
+        start = time.perf_counter()
+        # alt=sse asks for server-sent events instead of one JSON array at the end
+        response = self.post("streamGenerateContent", api_key, body, params={"alt": "sse"}, stream=True)
+        if response.status_code != 200:
+            try:
+                details = response.json()
+            except ValueError:
+                details = response.text
+            raise GeminiAPIError(response.status_code, details)
+
+        chunks = []
+        with response:
+            try:
+                for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+                    if not line or not line.startswith("data:"):
+                        continue
+                    event = json.loads(line[len("data:"):])
+                    for candidate in event.get("candidates", [])[:1]:
+                        for part in candidate.get("content", {}).get("parts", []):
+                            if part.get("text"):
+                                if not chunks:
+                                    with self._lock:
+                                        self._first_chunk_latencies.append(time.perf_counter() - start)
+                                chunks.append(part["text"])
+                                yield part["text"]
+            except requests.RequestException as e:
+                raise GeminiError(f"Error connecting to Gemini API: {e}") from e
+
+        if chunks and cache_key is not None:
+            self.cache.set(cache_key, "".join(chunks))
+
+    def metrics(self):
+        """Return call counters and latency statistics (seconds) over the recent window."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            first_chunk_latencies = sorted(self._first_chunk_latencies)
+            metrics = dict(self._counters)
+        if latencies:
+            metrics.update({
+                "latency_avg": sum(latencies) / len(latencies),
+                "latency_p50": latencies[len(latencies) // 2],
+                "latency_p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+                "latency_max": latencies[-1]
+            })
+        if first_chunk_latencies:
+            metrics["first_chunk_p50"] = first_chunk_latencies[len(first_chunk_latencies) // 2]
+        return metrics
@@ -0,0 +1,106 @@
+import json
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class GeminiStubHandler(BaseHTTPRequestHandler):
+    """Answers Gemini generateContent calls with a canned translation.
+
+    The server's fail_first attribute makes the first N requests return 503
+    (with a Retry-After header if retry_after is set), and delay adds latency
+    to every answer, to exercise timeouts and retries.
+    streamGenerateContent?alt=sse sends the same text word by word as
+    server-sent events, chunk_delay seconds apart.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload, headers=None):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_event_stream(self, text):
+        # Chunked like the real API, so clients can read each event as it is sent
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        words = text.split(" ")
+        for i, word in enumerate(words):
+            chunk = word if i == len(words) - 1 else word + " "
+            event = {"candidates": [{"content": {"parts": [{"text": chunk}], "role": "model"}}]}
+            data = f"data: {json.dumps(event)}\r\n\r\n".encode("utf-8")
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+            time.sleep(self.server.chunk_delay)
+        self.wfile.write(b"0\r\n\r\n")
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        with self.server.lock:
+            self.server.request_count += 1
+            request_number = self.server.request_count
+
+        if not self.headers.get("x-goog-api-key"):
+            self._send_json(403, {"error": {"code": 403, "message": "missing x-goog-api-key header"}})
+            return
+        if request_number <= self.server.fail_first:
+            headers = {"Retry-After": str(self.server.retry_after)} if self.server.retry_after is not None else None
+            self._send_json(503, {"error": {"code": 503, "message": "stub overloaded"}}, headers)
+            return
+        time.sleep(self.server.delay)
+
+        prompt = body.get("contents", [{}])[0].get("parts", [{}])[0].get("text", "")
+        text = f"Stub translation of {len(prompt)} prompt characters."
+        if ":streamGenerateContent" in self.path and "alt=sse" in self.path:
+            self._send_event_stream(text)
+        elif ":generateContent" in self.path:
+            self._send_json(200, {"candidates": [{"content": {"parts": [{"text": text}]}}]})
+        else:
+            self._send_json(404, {"error": {"code": 404, "message": f"unknown method {self.path}"}})
+
+
+def start_stub_server(port=0, fail_first=0, delay=0.0, verbose=False, chunk_delay=0.05, retry_after=None):
+    """Start the stub in a background thread; returns (server, base_url for GeminiClient)."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), GeminiStubHandler)
+    server.fail_first = fail_first
+    server.retry_after = retry_after
+    server.delay = delay
+    server.chunk_delay = chunk_delay
+    server.verbose = verbose
+    server.request_count = 0
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/v1beta"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stub of the Gemini REST API")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fail-first", type=int, default=0, help="answer the first N requests with 503")
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds to wait before answering")
+    parser.add_argument("--chunk-delay", type=float, default=0.05, help="seconds between streamed chunks")
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(args.port, args.fail_first, args.delay, verbose=True, chunk_delay=args.chunk_delay)
+    print(f"Gemini stub listening on {base_url} (use GeminiClient(base_url=...))")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
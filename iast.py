@@ -0,0 +1,42 @@
+import re
+import unicodedata
+
+# Anusvāra is written ṁ or ṃ, or as candrabindu m̐ (m + combining U+0310 after NFC)
+ANUSVARA = re.compile("[ṁṃ]|m̐")
+# Hyphens between compound members, apostrophes and the avagraha carry no meaning for matching
+SEPARATORS = re.compile("[-'’ʼऽ]")
+# ASCII stand-ins for long vowels and sibilants ("krishnaa", "shanti")
+ASCII_DIGRAPHS = re.compile("aa|ii|uu|sh")
+
+
+def normalize_text(text):
+    """NFC, lower-cased and stripped: the form token_dict keys and input words are compared in."""
+    return unicodedata.normalize("NFC", text).strip().lower()
+
+
+def fold_key(token):
+    """Spelling-insensitive key: anusvāra folded to m, visarga to h, separators dropped.
+
+    kiṁ, kiṃ and kim share a key, as do dharma-kṣetre and dharmakṣetre.
+    """
+    key = ANUSVARA.sub("m", normalize_text(token)).replace("ḥ", "h")
+    return SEPARATORS.sub("", key)
+
+
+def shadow_key(token):
+    """fold_key without diacritics and with ASCII digraphs collapsed, so "krsna" finds kṛṣṇa and "shaastra" śāstra."""
+    key = "".join(char for char in unicodedata.normalize("NFD", fold_key(token)) if not unicodedata.combining(char))
+    return ASCII_DIGRAPHS.sub(lambda match: match.group()[0], key)
+
+
+def has_diacritics(token):
+    """True if token is written with any diacritic (ā, ṛ, ś, ṁ...), i.e. not in plain ASCII letters."""
+    return any(unicodedata.combining(char) for char in unicodedata.normalize("NFD", token))
+
+
+def build_key_index(tokens, key_function):
+    """Map each key to the first token (in dictionary order) that produces it."""
+    index = {}
+    for token in tokens:
+        index.setdefault(key_function(token), token)
+    return index
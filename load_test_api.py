@@ -0,0 +1,88 @@
+import time
+import random
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from compiled_corpus import load_corpus
+
+
+def build_requests(corpus, count, mix, seed=0):
+    """Random (method, path, json) requests drawn from corpus shlokas and tokens, some with typos."""
+    rng = random.Random(seed)
+    tokens = [token_entry["token"] for shloka_entry in corpus for token_entry in shloka_entry.get("tokens", [])]
+
+    def misspell(word):
+        return word[:-1] if len(word) > 3 and rng.random() < 0.3 else word
+
+    planned = []
+    for _ in range(count):
+        endpoint = rng.choices(list(mix), weights=list(mix.values()))[0]
+        if endpoint == "analyze":
+            words = rng.choice(corpus)["shloka"].split()
+            planned.append(("POST", "/analyze", {"text": " ".join(misspell(word) for word in words)}))
+        elif endpoint == "lookup":
+            planned.append(("GET", f"/lookup?token={misspell(rng.choice(tokens))}", None))
+        else:
+            planned.append(("GET", f"/search?q={misspell(rng.choice(tokens))}&limit=5", None))
+    return planned
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the analysis API (see api.py)")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--corpus", default="sanskrit_corpus.json", help="corpus to draw request inputs from")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16, help="clients sending requests at once")
+    parser.add_argument("--analyze", type=float, default=0.6, help="share of /analyze requests")
+    parser.add_argument("--lookup", type=float, default=0.3, help="share of /lookup requests")
+    parser.add_argument("--search", type=float, default=0.1, help="share of /search requests")
+    args = parser.parse_args()
+
+    mix = {"analyze": args.analyze, "lookup": args.lookup, "search": args.search}
+    planned = build_requests(load_corpus(args.corpus), args.requests, mix)
+    base_url = args.url.rstrip("/")
+    local = threading.local()
+
+    def send(request):
+        # One keep-alive session per client thread
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+        method, path, body = request
+        start = time.perf_counter()
+        try:
+            response = local.session.request(method, base_url + path, json=body, timeout=30)
+            status = response.status_code
+        except requests.RequestException:
+            status = None
+        return path.split("?")[0], status, time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(send, planned))
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(results)} requests in {elapsed:.2f}s with {args.concurrency} clients: {len(results) / elapsed:.0f} req/s")
+    print(f"{'endpoint':<10} {'count':>6} {'errors':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for endpoint in ("/analyze", "/lookup", "/search"):
+        latencies = sorted(seconds for path, _, seconds in results if path == endpoint)
+        if not latencies:
+            continue
+        errors = sum(1 for path, status, _ in results if path == endpoint and status != 200)
+        print(f"{endpoint:<10} {len(latencies):>6} {errors:>6} {1000 * percentile(latencies, 0.5):>8.1f} "
+              f"{1000 * percentile(latencies, 0.95):>8.1f} {1000 * percentile(latencies, 0.99):>8.1f}")
+
+    try:
+        health = requests.get(base_url + "/health", timeout=5).json()
+        if health.get("batches"):
+            print(f"Server batched {health['batched_texts']} texts into {health['batches']} analysis calls (this worker)")
+    except (requests.RequestException, ValueError):
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import re
+import math
+import heapq
+from collections import Counter, defaultdict
+
+WORD = re.compile(r"\w+")
+# Too common in the meanings to say anything about a verse
+STOP_WORDS = frozenset(
+    "a an and are as at be by for from he his i in is it me my of on or so that the this to was who with you your".split()
+)
+
+
+def tokenize(text):
+    """Lower-cased words of a text (Sanskrit words keep their diacritics), without stop words."""
+    return [word for word in WORD.findall(text.lower()) if word not in STOP_WORDS]
+
+
+class BM25Index:
+    """Inverted index over a list of texts, ranked with Okapi BM25."""
+
+    def __init__(self, texts, k1=1.5, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings = defaultdict(list)
+        self.lengths = []
+        for doc_id, text in enumerate(texts):
+            words = tokenize(text)
+            self.lengths.append(len(words))
+            for word, count in Counter(words).items():
+                self.postings[word].append((doc_id, count))
+        self.average_length = sum(self.lengths) / len(self.lengths) if self.lengths else 0.0
+
+    def idf(self, word):
+        document_frequency = len(self.postings.get(word, ()))
+        return math.log(1 + (len(self.lengths) - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def search(self, query, limit=10):
+        """Return up to limit (doc_id, score) pairs, best first; only documents sharing a query word score."""
+        scores = defaultdict(float)
+        for word in set(tokenize(query)):
+            postings = self.postings.get(word)
+            if not postings:
+                continue
+            idf = self.idf(word)
+            for doc_id, count in postings:
+                length_norm = self.k1 * (1 - self.b + self.b * self.lengths[doc_id] / self.average_length)
+                scores[doc_id] += idf * count * (self.k1 + 1) / (count + length_norm)
+        return heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+
+
+class MeaningIndex:
+    """Full-text search over the English meanings in the corpus.
+
+    Two BM25 indexes are kept: one document per Sanskrit token (the token and
+    its combined meanings) and one per shloka (its tokens and their meanings),
+    so a query such as "intelligence" or "buddhi" finds both the words and the
+    verses that use them.
+    """
+
+    def __init__(self, token_dict, shloka_tokens):
+        """shloka_tokens holds one list of (token, meaning) pairs per corpus shloka, in corpus order."""
+        self.tokens = list(token_dict)
+        self.token_index = BM25Index(f"{token} {meaning}" for token, meaning in token_dict.items())
+        self.shloka_index = BM25Index(
+            " ".join(f"{token} {meaning}" for token, meaning in token_pairs) for token_pairs in shloka_tokens
+        )
+
+    def search_tokens(self, query, limit=10):
+        """Return up to limit (token, score) pairs, best first."""
+        return [(self.tokens[doc_id], score) for doc_id, score in self.token_index.search(query, limit)]
+
+    def search_shlokas(self, query, limit=10):
+        """Return up to limit (corpus offset, score) pairs, best first."""
+        return self.shloka_index.search(query, limit)
@@ -0,0 +1,101 @@
+from itertools import zip_longest
+
+# Separator between a token and its meaning, e.g. "uvāca—said"
+TOKEN_SEPARATOR = "—"
+PAIR_SEPARATOR = ";"
+OPENING_BRACKETS = "(["
+CLOSING_BRACKETS = ")]"
+
+
+def _iter_segments(text):
+    """Yield (column, segment) for every ';'-separated segment of a line.
+
+    Semicolons inside brackets belong to the meaning, as in
+    "mama—my (of me; mine)", so only top-level ones split pairs.
+    Columns are 1-based and point at the segment's first non-blank character.
+    """
+    depth = 0
+    start = 0
+    for position, char in enumerate(text):
+        if char in OPENING_BRACKETS:
+            depth += 1
+        elif char in CLOSING_BRACKETS:
+            depth = max(depth - 1, 0)
+        elif char == PAIR_SEPARATOR and depth == 0:
+            yield _segment_column(text, start, position), text[start:position]
+            start = position + 1
+    yield _segment_column(text, start, len(text)), text[start:]
+
+
+def _segment_column(text, start, end):
+    """1-based column of the first non-blank character in text[start:end]."""
+    segment = text[start:end]
+    return start + len(segment) - len(segment.lstrip()) + 1
+
+
+def iter_pairs(text, line_number=1, on_error=None, join_continuations=False):
+    """Yield {"token", "meaning"} records from one "token—meaning; token—meaning" line.
+
+    Malformed segments (no em-dash, empty token or meaning) are skipped and
+    passed to on_error(line_number, column, segment, reason) if given. With
+    join_continuations, a segment without an em-dash is instead treated as
+    the rest of the previous meaning, for meanings that contain "; ".
+    """
+    pending = None
+    for column, segment in _iter_segments(text):
+        if not segment.strip():
+            continue
+        if TOKEN_SEPARATOR not in segment:
+            if join_continuations and pending is not None:
+                pending["meaning"] = f"{pending['meaning']}; {segment.strip()}"
+            elif on_error:
+                on_error(line_number, column, segment.strip(), f"missing '{TOKEN_SEPARATOR}' between token and meaning")
+            continue
+
+        token, meaning = segment.split(TOKEN_SEPARATOR, 1)
+        if not token.strip() or not meaning.strip():
+            if on_error:
+                on_error(line_number, column, segment.strip(), "empty token" if not token.strip() else "empty meaning")
+            continue
+
+        if pending is not None:
+            yield pending
+        pending = {"token": token.strip(), "meaning": meaning.strip()}
+
+    if pending is not None:
+        yield pending
+
+
+def iter_meaning_file(meanings_file, on_error=None, join_continuations=False):
+    """Yield (line_number, tokens) per line of a meanings file, reading it line by line."""
+    with open(meanings_file, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            yield line_number, list(iter_pairs(line.rstrip("\r\n"), line_number, on_error, join_continuations))
+
+
+def iter_shloka_entries(chapter, shlokas_file, meanings_file, on_error=None, on_mismatch=None):
+    """Yield corpus entries by streaming a shloka file and its meanings file side by side.
+
+    Pairing stops at the shorter file; on_mismatch(shloka_count, meaning_count)
+    is called once both files are read if their line counts differ.
+    """
+    shloka_count = meaning_count = 0
+    with open(shlokas_file, "r", encoding="utf-8") as shloka_lines:
+        meaning_lines = iter_meaning_file(meanings_file, on_error)
+        for shloka_line, meaning_line in zip_longest(shloka_lines, meaning_lines):
+            shloka_count += shloka_line is not None
+            meaning_count += meaning_line is not None
+            if shloka_line is None or meaning_line is None:
+                continue
+            yield {
+                "shloka_number": f"{chapter}.{shloka_count}",
+                "shloka": shloka_line.strip(),
+                "tokens": meaning_line[1]
+            }
+    if on_mismatch and shloka_count != meaning_count:
+        on_mismatch(shloka_count, meaning_count)
+
+
+def print_malformed_pair(meanings_file, line_number, column, segment, reason):
+    """on_error handler for the ingestion scripts; bind meanings_file with functools.partial."""
+    print(f"{meanings_file}:{line_number}:{column}: {reason}: {segment!r}")
@@ -0,0 +1,65 @@
+import re
+from iast import fold_key
+from sandhi import TokenTrie
+
+# Multi-word tokens are written "śrī bhagavān uvāca", "karma-yogena" or "yukta- ātmā"
+WORD_SEPARATOR = re.compile(r"[\s-]+")
+
+
+class PhraseMatcher:
+    """Longest-match lookup of multi-word corpus tokens in a list of input words.
+
+    Every token made of several space or hyphen separated words is added to
+    a trie keyed by the fold_key of its words, so "karma yogena" finds
+    karma-yogena and anusvāra/visarga spellings do not matter. segments()
+    makes a single left-to-right pass that tries, at each word, at most as
+    many words as the longest phrase has, so it is linear in the input.
+    """
+
+    def __init__(self, tokens):
+        self.phrases = {}
+        for token in tokens:
+            words = [word for word in WORD_SEPARATOR.split(token) if word]
+            if len(words) > 1:
+                self.phrases.setdefault(tuple(fold_key(word) for word in words), token)
+        self.trie = TokenTrie(self.phrases)
+
+    def longest_match(self, keys, start, ends=None):
+        """Return (end, token) for the longest phrase starting at keys[start], or None.
+
+        With ends, only phrases ending just before one of those positions count.
+        """
+        node = self.trie.root
+        match = None
+        for end in range(start, len(keys)):
+            node = node.get(keys[end])
+            if node is None:
+                break
+            if None in node and (ends is None or end + 1 in ends):
+                match = end + 1, self.phrases[node[None]]
+        return match
+
+    def segments(self, words):
+        """Yield (words, phrase token or None) covering words in order, phrases taking the longest match.
+
+        Input words are split on hyphens too, so "śrī-bhagavān uvāca" finds
+        śrī bhagavān uvāca; a phrase must start and end on whole input words.
+        """
+        keys = []
+        word_starts = []
+        for word in words:
+            word_starts.append(len(keys))
+            keys.extend(fold_key(part) for part in WORD_SEPARATOR.split(word) if part)
+            if len(keys) == word_starts[-1]:
+                keys.append(fold_key(word))
+        ends = {position: index for index, position in enumerate(word_starts[1:] + [len(keys)], 1)}
+        start = 0
+        while start < len(words):
+            match = self.longest_match(keys, word_starts[start], ends) if self.phrases else None
+            if match:
+                end = ends[match[0]]
+                yield words[start:end], match[1]
+                start = end
+            else:
+                yield words[start:start + 1], None
+                start += 1
@@ -0,0 +1,85 @@
+import os
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from app import SanskritAnalyzer, build_word_by_word, build_translation_prompt, TRANSLATION_GENERATION_CONFIG
+from gemini_client import GeminiClient, RateLimiter, DEFAULT_BASE_URL
+from translation_cache import TranslationCache
+from translation_store import TranslationStore
+
+
+def translate_shloka(client, limiter, api_key, word_meanings):
+    """Worker: translate one shloka once the rate limiter allows it."""
+    limiter.acquire()
+    return client.generate_text(build_translation_prompt(word_meanings), api_key, TRANSLATION_GENERATION_CONFIG)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute Gemini translations for every corpus shloka")
+    parser.add_argument("--corpus", default="sanskrit_corpus.json")
+    parser.add_argument("--store", default="shloka_translations.json")
+    parser.add_argument("--threshold", type=int, default=75, help="fuzzy matching threshold used for the analysis")
+    parser.add_argument("--concurrency", type=int, default=4, help="requests in flight at once")
+    parser.add_argument("--rate", type=float, default=60, help="maximum requests per minute")
+    parser.add_argument("--limit", type=int, default=None, help="only translate this many missing shlokas")
+    parser.add_argument("--force", action="store_true", help="retranslate shlokas that are already stored")
+    parser.add_argument("--api-key", default=os.getenv("GEMINI_API_KEY", ""))
+    parser.add_argument("--base-url", default=os.getenv("GEMINI_BASE_URL", DEFAULT_BASE_URL))
+    args = parser.parse_args()
+
+    if not args.api_key:
+        parser.error("a Gemini API key is required (--api-key or GEMINI_API_KEY)")
+
+    analyzer = SanskritAnalyzer(corpus_file=args.corpus)
+    store = TranslationStore(args.store)
+    pending = [
+        shloka_entry for shloka_entry in analyzer.corpus
+        if args.force or shloka_entry["shloka"] not in store
+    ][:args.limit]
+    print(f"{len(analyzer.corpus)} shlokas in corpus, {len(store)} already stored, {len(pending)} to translate")
+
+    client = GeminiClient(
+        base_url=args.base_url,
+        cache=TranslationCache(os.getenv("TRANSLATION_CACHE_PATH", "translation_cache.sqlite3"))
+    )
+    limiter = RateLimiter(args.rate)
+    analyses = analyzer.get_meanings_for_inputs([shloka_entry["shloka"] for shloka_entry in pending], args.threshold)
+    analyzer.close()
+
+    start = time.perf_counter()
+    done = failed = 0
+    try:
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            futures = {}
+            for shloka_entry, analysis_results in zip(pending, analyses):
+                _, word_meanings = build_word_by_word(analysis_results)
+                future = pool.submit(translate_shloka, client, limiter, args.api_key, word_meanings)
+                futures[future] = (shloka_entry, word_meanings)
+
+            for future in as_completed(futures):
+                shloka_entry, word_meanings = futures[future]
+                try:
+                    translation = future.result()
+                except Exception as e:
+                    # Unexpected response bodies (KeyError, ValueError) fail this shloka, not the run
+                    failed += 1
+                    print(f"{shloka_entry['shloka_number']}: {e}")
+                    continue
+                if translation is None:
+                    failed += 1
+                    print(f"{shloka_entry['shloka_number']}: no response text was generated")
+                    continue
+                store.put(shloka_entry["shloka"], shloka_entry["shloka_number"], word_meanings, translation)
+                done += 1
+                # Save as we go so an interrupted run keeps its progress
+                if done % 25 == 0:
+                    store.save()
+                    print(f"{done}/{len(pending)} translated")
+    finally:
+        store.save()
+    elapsed = time.perf_counter() - start
+    print(f"Translated {done} shlokas ({failed} failed) in {elapsed:.1f}s; store now holds {len(store)} -> {args.store}")
+
+
+if __name__ == "__main__":
+    main()
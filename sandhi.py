@@ -0,0 +1,153 @@
+import functools
+from iast import SEPARATORS
+
+# (surface, end of the left word, start of the right word): the text written
+# at a junction and what the two words looked like before sandhi joined them.
+# "vyāmiśreṇeva" is vyāmiśreṇa + iva through ("e", "a", "i").
+SANDHI_RULES = [
+    # Vowel sandhi
+    ("ā", "a", "a"), ("ā", "a", "ā"), ("ā", "ā", "a"), ("ā", "ā", "ā"),
+    ("ī", "i", "i"), ("ī", "i", "ī"), ("ī", "ī", "i"), ("ī", "ī", "ī"),
+    ("ū", "u", "u"), ("ū", "u", "ū"), ("ū", "ū", "u"), ("ū", "ū", "ū"),
+    ("e", "a", "i"), ("e", "a", "ī"), ("e", "ā", "i"), ("e", "ā", "ī"),
+    ("o", "a", "u"), ("o", "a", "ū"), ("o", "ā", "u"), ("o", "ā", "ū"),
+    ("ai", "a", "e"), ("ai", "ā", "e"), ("ai", "a", "ai"), ("ai", "ā", "ai"),
+    ("au", "a", "o"), ("au", "ā", "o"), ("au", "a", "au"), ("au", "ā", "au"),
+    ("ar", "a", "ṛ"), ("ar", "ā", "ṛ"),
+    # i/u/e/o/ai/au before a vowel; the vowel stays with the right word
+    ("y", "i", ""), ("y", "ī", ""), ("v", "u", ""), ("v", "ū", ""),
+    ("ay", "e", ""), ("av", "o", ""), ("āy", "ai", ""), ("āv", "au", ""),
+    # e/o + a: the a is written as an avagraha
+    ("'", "", "a"),
+    # Visarga
+    ("o", "aḥ", ""), ("ā", "āḥ", ""), ("r", "ḥ", ""),
+    ("ś", "ḥ", ""), ("ṣ", "ḥ", ""), ("s", "ḥ", ""),
+    # Final consonants
+    ("d", "t", ""), ("c", "t", ""), ("j", "t", ""), ("n", "t", ""), ("l", "t", ""), ("cch", "t", "ś"),
+    ("g", "k", ""), ("ṅ", "k", ""), ("ḍ", "ṭ", ""), ("b", "p", ""),
+    ("ṁ", "m", ""), ("ñ", "m", ""), ("ṅ", "m", ""), ("n", "m", ""),
+    ("nn", "n", ""), ("cch", "", "ch")
+]
+
+
+def compile_rules(rules):
+    """Group rules by the first character of their surface, for lookup while walking a word."""
+    compiled = {}
+    for surface, left_end, right_start in rules:
+        compiled.setdefault(surface[0], []).append((surface, left_end, right_start))
+    return compiled
+
+
+class TokenTrie:
+    """Trie over sequences (the characters of tokens, or the words of phrases); each end node holds its sequence."""
+
+    def __init__(self, tokens):
+        self.root = {}
+        for token in tokens:
+            node = self.root
+            for char in token:
+                node = node.setdefault(char, {})
+            node.setdefault(None, token)
+
+    def walk(self, node, text):
+        """Follow text from node; returns the node reached or None."""
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                return None
+        return node
+
+
+class SandhiSplitter:
+    """Splits a word written with sandhi into corpus tokens.
+
+    A trie of the corpus tokens (hyphens dropped, so compound members can
+    be joined back) is walked along the word. Wherever a token may end, the
+    word either continues unchanged with the next token or, when a sandhi
+    rule's surface form follows, the rule restores the left word's ending
+    and the right word's start. Dynamic programming over (position, restored
+    start) picks the split with the fewest tokens, then the most rules, then
+    the most frequent tokens (frequencies maps tokens to how often the corpus
+    uses them, so tathaiva is tathā + eva rather than the rare tatha).
+    Words are memoized, as the same joined forms recur across verses.
+    """
+
+    def __init__(self, tokens, rules=SANDHI_RULES, max_parts=4, min_token_length=2, cache_size=8192, frequencies=None):
+        self.max_parts = max_parts
+        self.rules = compile_rules(rules)
+        self.tokens = {}
+        self.frequencies = {}
+        for token in tokens:
+            if " " in token:
+                continue
+            key = SEPARATORS.sub("", token)
+            if len(key) >= min_token_length:
+                self.tokens.setdefault(key, token)
+                # Spellings that only differ by hyphens are one key; their uses add up
+                self.frequencies[key] = self.frequencies.get(key, 0) + (frequencies or {}).get(token, 0)
+        self.trie = TokenTrie(self.tokens)
+        # No longer word can split into max_parts tokens; the cap also bounds the recursion depth
+        longest_surface = max(len(surface) for surface, _, _ in rules)
+        self.max_word_length = max_parts * (max(map(len, self.tokens), default=0) + longest_surface)
+        self.split = functools.lru_cache(maxsize=cache_size)(self._split)
+
+    def _split(self, word):
+        """Return the corpus tokens word resolves into through sandhi, or None."""
+        word = SEPARATORS.sub("", word)
+        if len(word) > self.max_word_length:
+            return None
+
+        @functools.lru_cache(maxsize=None)
+        def best(position, carry):
+            # Cheapest (parts, rules, frequency, tokens) reading of carry + word[position:], or None
+            node = self.trie.walk(self.trie.root, carry)
+            if node is None:
+                return None
+            candidates = []
+            index = position
+            while node is not None:
+                if None in node:
+                    token = node[None]
+                    if index == len(word):
+                        candidates.append((1, 0, self.frequencies[token], (token,)))
+                    elif index > position or carry:
+                        candidates.append(self._extend(best(index, ""), token, 0))
+                for surface, left_end, right_start in self.rules.get(word[index], ()) if index < len(word) else ():
+                    if not word.startswith(surface, index):
+                        continue
+                    end_node = self.trie.walk(node, left_end)
+                    if end_node is None or None not in end_node:
+                        continue
+                    if index + len(surface) == len(word) and not right_start:
+                        # Sandhi with the next word, e.g. karmaṇy (evādhikāras)
+                        candidates.append((1, 1, self.frequencies[end_node[None]], (end_node[None],)))
+                    else:
+                        rest = best(index + len(surface), right_start)
+                        candidates.append(self._extend(rest, end_node[None], 1))
+                if index == len(word):
+                    break
+                node = node.get(word[index])
+                index += 1
+            candidates = [candidate for candidate in candidates if candidate and candidate[0] <= self.max_parts]
+            return min(candidates, key=self._cost, default=None)
+
+        result = best(0, "")
+        best.cache_clear()
+        # A single part is only a split if a rule restored its ending
+        if result is None or result[0] + result[1] < 2:
+            return None
+        return [self.tokens[key] for key in result[3]]
+
+    @staticmethod
+    def _cost(candidate):
+        # Fewest parts, then the most rules: corpus tokens are split at sandhi
+        # junctions, so two tokens simply written together is the rarer reading.
+        # Remaining ties go to the tokens the corpus uses most, not the alphabet
+        parts, rules, frequency, tokens = candidate
+        return parts, -rules, -frequency, tokens
+
+    def _extend(self, rest, token, rules):
+        if rest is None:
+            return None
+        parts, rest_rules, frequency, tokens = rest
+        return parts + 1, rest_rules + rules, frequency + self.frequencies[token], (token,) + tokens
@@ -0,0 +1,73 @@
+import math
+from collections import Counter, defaultdict
+import numpy as np
+
+
+def _char_ngrams(text, n=3):
+    """Counts of the character n-grams of a text, lower-cased with whitespace collapsed and padded."""
+    padded = f" {' '.join(text.lower().split())} "
+    return Counter(padded[i:i + n] for i in range(len(padded) - n + 1))
+
+
+class ShlokaSimilarityIndex:
+    """Finds the corpus verses most similar to a whole input verse.
+
+    Each shloka is a TF-IDF vector of character n-grams (sublinear term
+    frequency, L2-normalized), stored as a sparse matrix in compressed column
+    form: for every n-gram, the rows (shlokas) that contain it and their
+    weights. Character n-grams tolerate variant spellings and sandhi that
+    defeat word-by-word matching. A query only touches the columns of its own
+    n-grams, and the cosine similarities are accumulated with numpy.
+    """
+
+    def __init__(self, texts, n=3):
+        self.n = n
+        rows_by_gram = defaultdict(list)
+        weights_by_gram = defaultdict(list)
+        self.size = 0
+        for row, text in enumerate(texts):
+            for gram, count in _char_ngrams(text, n).items():
+                rows_by_gram[gram].append(row)
+                weights_by_gram[gram].append(1 + math.log(count))
+            self.size = row + 1
+
+        self.columns = {gram: column for column, gram in enumerate(rows_by_gram)}
+        self.idf = np.array([
+            math.log((1 + self.size) / (1 + len(rows_by_gram[gram]))) + 1 for gram in self.columns
+        ])
+        self.indptr = np.zeros(len(self.columns) + 1, dtype=np.int64)
+        self.indptr[1:] = np.cumsum([len(rows_by_gram[gram]) for gram in self.columns])
+        self.indices = np.fromiter((row for gram in self.columns for row in rows_by_gram[gram]), dtype=np.int64)
+        self.data = np.fromiter((weight for gram in self.columns for weight in weights_by_gram[gram]), dtype=np.float64)
+        self.data *= np.repeat(self.idf, np.diff(self.indptr))
+
+        # L2-normalize each row so the dot product is the cosine similarity
+        norms = np.sqrt(np.bincount(self.indices, weights=self.data ** 2, minlength=self.size))
+        self.data /= norms[self.indices]
+
+    def _query_vector(self, text):
+        """Column ids and normalized TF-IDF weights of the query's known n-grams."""
+        grams = _char_ngrams(text, self.n)
+        known = [(self.columns[gram], 1 + math.log(count)) for gram, count in grams.items() if gram in self.columns]
+        columns = np.array([column for column, _ in known], dtype=np.int64)
+        weights = np.array([weight for _, weight in known]) * self.idf[columns]
+        # n-grams no shloka has still count towards the query's norm, with the highest idf
+        unseen_idf = math.log(1 + self.size) + 1
+        unseen_squares = sum(((1 + math.log(count)) * unseen_idf) ** 2 for gram, count in grams.items() if gram not in self.columns)
+        norm = math.sqrt(float(np.dot(weights, weights)) + unseen_squares)
+        return columns, weights / norm if norm else weights
+
+    def search(self, text, k=5):
+        """Return up to k (row, cosine similarity) pairs, most similar first."""
+        columns, weights = self._query_vector(text)
+        if not len(columns) or not self.size:
+            return []
+        scores = np.zeros(self.size)
+        for column, weight in zip(columns, weights):
+            start, end = self.indptr[column], self.indptr[column + 1]
+            # Rows within a column are unique, so fancy-index += is safe
+            scores[self.indices[start:end]] += weight * self.data[start:end]
+        k = min(k, self.size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(row), float(scores[row])) for row in top if scores[row] > 0]
@@ -0,0 +1,68 @@
+import re
+from rapidfuzz.distance import Indel
+from iast import fold_key, normalize_text
+
+# Common nominal and verbal endings in fold_key form (ḥ -> h, ṁ -> m)
+SUFFIXES = sorted({
+    # a-stems
+    "ah", "am", "ena", "eṇa", "aya", "āya", "āt", "asya", "au", "ābhyām", "aih", "ebhyah", "ānām", "āṇām", "esu", "eṣu",
+    "āh", "ān", "āni", "āṇi", "ā", "ayā", "āyāh", "āyām", "āyai", "ābhih", "āsu", "āsām",
+    # i- and u-stems
+    "ih", "im", "inā", "iṇā", "aye", "eh", "ayah", "īn", "ibhih", "ibhyah", "īnām", "īṇām", "isu", "iṣu", "ī", "īni", "īṇi",
+    "uh", "um", "unā", "uṇā", "ave", "oh", "avah", "ūn", "ubhih", "ubhyah", "ūnām", "ūṇām", "usu", "uṣu", "ūni", "ūṇi",
+    # consonant stems
+    "anah", "aṇah", "ani", "aṇi", "anā", "aṇā", "ane", "aṇe", "ānam", "āṇam", "ānau", "ānah", "abhih", "asah", "asā", "ase",
+    # verbs and participles
+    "ati", "anti", "asi", "atha", "āmi", "āmah", "ate", "ante", "āmahe", "tum", "itum", "tvā", "itvā",
+    "vān", "vantah", "mānah", "mānam", "antam", "antah"
+}, key=len, reverse=True)
+STEM_FINALS = "aāiīuūṛeonṇ"
+# A leading avagraha stands for the a elided after e/o ('śubhāt is aśubhāt)
+LEADING_AVAGRAHA = re.compile("^['’ʼऽ]")
+
+
+def stem_form(word):
+    """The spelling stems are taken from: fold_key with a leading avagraha read as a."""
+    return fold_key(LEADING_AVAGRAHA.sub("a", normalize_text(word)))
+
+
+def stem(word, min_length=3):
+    """Coarse stem of an IAST word: its fold_key without the longest known ending and stem-final vowels/n.
+
+    karmaṇaḥ, karmaṇi and karma all stem to "karm", buddhiḥ and buddhim to "buddh".
+    """
+    key = stem_form(word)
+    for suffix in SUFFIXES:
+        if key.endswith(suffix) and len(key) - len(suffix) >= min_length:
+            key = key[:-len(suffix)]
+            break
+    while len(key) > min_length and key[-1] in STEM_FINALS:
+        key = key[:-1]
+    return key
+
+
+class StemIndex:
+    """Maps stems to the corpus tokens sharing them, to resolve other case endings of a known word."""
+
+    def __init__(self, tokens, min_length=3):
+        self.min_length = min_length
+        self.stems = {}
+        for token in tokens:
+            if " " not in token:
+                self.stems.setdefault(stem(token, min_length), []).append((token, stem_form(token)))
+
+    def get_most_similar(self, word, threshold=0):
+        """Return (token, score) for the token sharing word's stem that is closest in spelling, or (None, 0).
+
+        Spellings are compared in stem_form, so 'haṁ scores 100 against aham.
+        """
+        candidates = self.stems.get(stem(word, self.min_length))
+        if not candidates:
+            return None, 0
+        form = stem_form(word)
+        # max keeps the first of equally close tokens, in dictionary order
+        best_token, best_form = max(candidates, key=lambda candidate: Indel.normalized_similarity(form, candidate[1]))
+        score = int(round(100 * Indel.normalized_similarity(form, best_form)))
+        if score < threshold:
+            return None, 0
+        return best_token, score
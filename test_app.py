@@ -0,0 +1,24 @@
+import pytest
+from app import SanskritAnalyzer, SHLOKA_REFERENCE
+
+
+@pytest.fixture
+def analyzer():
+    corpus = [
+        {"shloka_number": "2.47", "shloka": "karmaṇy evādhikāras te", "tokens": [{"token": "karmaṇi", "meaning": "in action"}]},
+        {"shloka_number": "2.48", "shloka": "yogasthaḥ kuru karmāṇi", "tokens": [{"token": "kuru", "meaning": "do"}]}
+    ]
+    with SanskritAnalyzer(corpus_data=corpus) as analyzer:
+        yield analyzer
+
+
+@pytest.mark.parametrize("reference", ["2.47", "2.047", "02.47", "2:47", "2 047"])
+def test_shloka_references_ignore_leading_zeros(analyzer, reference):
+    shloka = analyzer.get_shloka(*map(int, SHLOKA_REFERENCE.match(reference).groups()))
+    assert shloka["shloka_number"] == "2.47"
+
+
+def test_get_shloka_accepts_zero_padded_strings(analyzer):
+    assert analyzer.get_shloka("02", "047")["shloka_number"] == "2.47"
+    assert [shloka["shloka_number"] for shloka in analyzer.get_shlokas("02", "047", "048")] == ["2.47", "2.48"]
+    assert analyzer.verses("02") == ["47", "48"]
@@ -0,0 +1,65 @@
+import time
+import pytest
+from gemini_client import GeminiClient, GeminiError, GeminiAPIError
+from gemini_stub import start_stub_server
+
+
+@pytest.fixture
+def stub():
+    servers = []
+
+    def start(**kwargs):
+        server, base_url = start_stub_server(chunk_delay=0, **kwargs)
+        servers.append(server)
+        return server, base_url
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_retries_until_the_stub_answers(stub):
+    server, base_url = stub(fail_first=2)
+    client = GeminiClient(base_url=base_url, backoff_factor=0)
+    assert client.generate_text("dharma", "test-key") == "Stub translation of 6 prompt characters."
+    assert server.request_count == 3
+    assert client.metrics()["retries"] == 2
+
+
+def test_waits_for_retry_after(stub):
+    server, base_url = stub(fail_first=1, retry_after=1)
+    client = GeminiClient(base_url=base_url, backoff_factor=0)
+    start = time.perf_counter()
+    assert client.generate_text("dharma", "test-key")
+    assert time.perf_counter() - start >= 1
+    assert server.request_count == 2
+
+
+def test_gives_up_on_retry_after_beyond_max_retry_delay(stub):
+    server, base_url = stub(fail_first=1, retry_after=600)
+    client = GeminiClient(base_url=base_url, max_retry_delay=5)
+    start = time.perf_counter()
+    with pytest.raises(GeminiAPIError) as error:
+        client.generate_text("dharma", "test-key")
+    assert error.value.status_code == 503
+    assert time.perf_counter() - start < 1
+    assert server.request_count == 1
+
+
+def test_total_timeout_bounds_the_whole_call(stub):
+    # Every attempt times out; without the deadline this would take 10 x 0.5 s
+    server, base_url = stub(delay=2)
+    client = GeminiClient(base_url=base_url, read_timeout=0.5, max_retries=9, backoff_factor=0, total_timeout=1.2)
+    start = time.perf_counter()
+    with pytest.raises(GeminiError):
+        client.generate_text("dharma", "test-key")
+    assert time.perf_counter() - start < 1.5
+    assert server.request_count <= 3
+
+
+def test_api_key_is_not_in_error_messages():
+    client = GeminiClient(base_url="http://127.0.0.1:1/v1beta", max_retries=0)
+    with pytest.raises(GeminiError) as error:
+        client.generate_text("dharma", "SECRETKEY123")
+    assert "SECRETKEY123" not in str(error.value)
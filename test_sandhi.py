@@ -0,0 +1,13 @@
+from sandhi import SandhiSplitter
+
+
+def test_ties_go_to_the_more_frequent_token():
+    # tatha + eva and tathā + eva both join to tathaiva with one rule
+    splitter = SandhiSplitter(["tatha", "tathā", "eva"], frequencies={"tatha": 1, "tathā": 42, "eva": 155})
+    assert splitter.split("tathaiva") == ["tathā", "eva"]
+
+
+def test_ties_follow_frequency_not_spelling():
+    splitter = SandhiSplitter(["tatha", "tathā", "eva"], frequencies={"tatha": 42, "tathā": 1, "eva": 155})
+    assert splitter.split("tathaiva") == ["tatha", "eva"]
+
@@ -0,0 +1,102 @@
+import json
+import contextlib
+import time
+import sqlite3
+import hashlib
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    key TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS translations_last_used ON translations (last_used);
+"""
+
+
+def make_cache_key(prompt, model, generation_config=None):
+    """Hash of everything that determines a Gemini response."""
+    payload = json.dumps(
+        {"prompt": prompt, "model": model, "generationConfig": generation_config or {}},
+        sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TranslationCache:
+    """Disk-backed cache of generated translations in SQLite.
+
+    The database runs in WAL mode and every operation opens its own
+    connection, so one file can be shared by threads, Streamlit sessions
+    and separate worker processes. Entries expire after ttl_seconds and the
+    least recently used ones are evicted beyond max_entries.
+    """
+
+    def __init__(self, path="translation_cache.sqlite3", ttl_seconds=30 * 24 * 3600, max_entries=10000):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0}
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+
+    @contextlib.contextmanager
+    def _connect(self):
+        """Open a connection for one transaction and always close it."""
+        connection = sqlite3.connect(self.path, timeout=10)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _count(self, counter):
+        with self._lock:
+            self._counters[counter] += 1
+
+    def get(self, key):
+        """Return the cached text for key, or None if it is missing or expired."""
+        now = time.time()
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT text, created_at FROM translations WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                if row is not None:
+                    connection.execute("DELETE FROM translations WHERE key = ?", (key,))
+                self._count("misses")
+                return None
+            connection.execute("UPDATE translations SET last_used = ? WHERE key = ?", (now, key))
+        self._count("hits")
+        return row[0]
+
+    def set(self, key, text):
+        """Store text under key, then drop expired and least recently used entries."""
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO translations (key, text, created_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, text, now, now)
+            )
+            connection.execute("DELETE FROM translations WHERE created_at < ?", (now - self.ttl_seconds,))
+            connection.execute(
+                "DELETE FROM translations WHERE key IN ("
+                "SELECT key FROM translations ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+    def clear(self):
+        """Remove every cached translation."""
+        with self._connect() as connection:
+            connection.execute("DELETE FROM translations")
+
+    def stats(self):
+        """Return hit/miss counts of this process and the number of stored entries."""
+        with self._connect() as connection:
+            entries = connection.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        with self._lock:
+            return dict(self._counters, entries=entries)
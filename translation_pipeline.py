@@ -0,0 +1,69 @@
+import re
+import time
+import asyncio
+from gemini_client import GeminiError
+
+# Shlokas are separated by line breaks or by danda verse markers
+SHLOKA_SEPARATOR = re.compile(r"\n|॥|\|\|")
+
+
+def split_shlokas(text):
+    """Split multi-line input into individual shlokas/lines, dropping empty ones."""
+    return [part.strip() for part in SHLOKA_SEPARATOR.split(text) if part.strip()]
+
+
+def estimate_tokens(prompt, generation_config=None):
+    """Rough token cost of a request: ~4 characters per prompt token plus the output allowance."""
+    output_tokens = (generation_config or {}).get("maxOutputTokens", 0)
+    return len(prompt) // 4 + 1 + output_tokens
+
+
+class TokenBudget:
+    """Asyncio token bucket holding at most `tokens_per_minute`, refilled continuously."""
+
+    def __init__(self, tokens_per_minute):
+        self.capacity = tokens_per_minute
+        self.rate = tokens_per_minute / 60.0
+        self.available = float(tokens_per_minute)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens):
+        """Wait until `tokens` can be spent without exceeding the per-minute budget."""
+        tokens = min(tokens, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.available >= tokens:
+                    self.available -= tokens
+                    return
+                await asyncio.sleep((tokens - self.available) / self.rate)
+
+
+async def translate_concurrently(client, api_key, prompts, generation_config=None, concurrency=4, tokens_per_minute=None):
+    """Yield (index, translation) for every prompt as soon as its translation completes.
+
+    At most `concurrency` requests are in flight and, with tokens_per_minute,
+    requests wait for budget before they are sent. The blocking GeminiClient
+    calls run in worker threads so its pooled session, retries and cache are
+    reused. Errors are yielded as their message, like get_gemini_translation.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    budget = TokenBudget(tokens_per_minute) if tokens_per_minute else None
+
+    async def translate(index, prompt):
+        async with semaphore:
+            if budget:
+                await budget.acquire(estimate_tokens(prompt, generation_config))
+            try:
+                text = await asyncio.to_thread(client.generate_text, prompt, api_key, generation_config)
+            except GeminiError as e:
+                text = str(e)
+            except Exception as e:
+                text = f"Error connecting to Gemini API: {str(e)}"
+        return index, text if text is not None else "No response text was generated by the API."
+
+    for finished in asyncio.as_completed([translate(index, prompt) for index, prompt in enumerate(prompts)]):
+        yield await finished
@@ -0,0 +1,51 @@
+import os
+import json
+import threading
+
+
+def normalize_shloka(text):
+    """Lower-case and collapse whitespace so pasted verses match their corpus text."""
+    return " ".join(text.lower().split())
+
+
+class TranslationStore:
+    """Precomputed translations of corpus shlokas, kept in one JSON file.
+
+    Entries are keyed by the normalized shloka text and hold the shloka
+    number, the word meanings sent to Gemini and the generated translation.
+    """
+
+    def __init__(self, path="shloka_translations.json"):
+        self.path = path
+        self._lock = threading.Lock()
+        self.entries = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, shloka_text):
+        return normalize_shloka(shloka_text) in self.entries
+
+    def get(self, shloka_text):
+        """Return the stored entry for a shloka text, or None."""
+        return self.entries.get(normalize_shloka(shloka_text))
+
+    def put(self, shloka_text, shloka_number, word_meanings, translation):
+        """Add or replace the entry for a shloka."""
+        with self._lock:
+            self.entries[normalize_shloka(shloka_text)] = {
+                "shloka_number": shloka_number,
+                "word_meanings": word_meanings,
+                "translation": translation
+            }
+
+    def save(self):
+        """Write the store atomically, so readers never see a half-written file."""
+        with self._lock:
+            temporary_path = f"{self.path}.tmp"
+            with open(temporary_path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=2)
+            os.replace(temporary_path, self.path)
@@ -1,13 +1,14 @@
 import streamlit as st
 import json
-from fuzzywuzzy import fuzz
+from fuzzy_index import NgramIndex
 import pandas as pd
 import io
 import base64
 
 class SanskritAnalyzer:
-    def __init__(self, corpus_data=None, corpus_file=None):
+    def __init__(self, corpus_data=None, corpus_file=None, index_class=NgramIndex):
         """Initialize with either direct corpus data or a file path."""
+        self.index_class = index_class
         self.corpus = corpus_data if corpus_data else self._load_corpus(corpus_file)
         self.token_dict = self._build_token_dictionary()
         
@@ -36,21 +37,15 @@ class SanskritAnalyzer:
                         token_meaning_dict[token] = f"{existing_meaning}; {meaning}"
                 else:
                     token_meaning_dict[token] = meaning
+
+        # Candidate index for fuzzy lookups, built once per corpus
+        self.fuzzy_index = self.index_class(token_meaning_dict.keys())
         return token_meaning_dict
     
     def get_most_similar_token(self, input_token, threshold=75):
         """Find the most similar token from the corpus with similarity ≥ threshold."""
         input_token = input_token.strip().lower()
-        best_match = None
-        best_score = 0
-
-        for token in self.token_dict.keys():
-            score = fuzz.ratio(input_token, token)
-            if score > best_score and score >= threshold:
-                best_match = token
-                best_score = score
-
-        return best_match, best_score
+        return self.fuzzy_index.get_most_similar(input_token, threshold)
 
     def get_meanings_for_input(self, input_sentence, threshold=75):
         """Finds English meanings for each word in input Sanskrit sentence."""